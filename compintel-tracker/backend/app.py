@@ -1,56 +1,67 @@
-import json
 import datetime
 from datetime import timedelta
-from flask import Flask, jsonify, request
+from flask import Blueprint, Flask, current_app, jsonify, request
 from flask_cors import CORS
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import desc, or_
+from sqlalchemy import desc, insert, literal, or_, select
 import logging
 
 # 🌟 NEW IMPORTS FOR MAILING AND SCHEDULING 🌟
-from flask_mail import Mail, Message
 from threading import Thread
 import time 
 
 # --- Import from your modules ---
-from models import init_db, SessionLocal, Article, Competitor
-from fetcher import fetch_and_extract 
-from summarizer import summarize_text 
-
-app = Flask(__name__, static_folder="../frontend/dist", static_url_path="/")
-CORS(app)  # Allow CORS for all origins during development
+# Only light modules are imported here. The scraping stack (feedparser, bs4/lxml, requests),
+# the LLM stack (ollama, numpy) and Flask-Mail are imported on first use, so workers that
+# only serve read endpoints never load them.
+from models import SessionLocal, Article, ArticleTombstone, Competitor, TrendRollup
+from responses import init_responses
+from trends import query_trends, ROLLUP_DIMENSIONS, DEFAULT_RANGE_DAYS, MAX_RANGE_DAYS
+from export import EXPORT_FORMATS, ExportParamError, parse_export_params, parse_utc_datetime, stream_export
+from classifier import (
+    CRITICAL_KPI_KEYWORDS, INSIGHT_STATUSES, classify_feed_article, classify_insight_article, collect_digest_insights
+)
+
+api = Blueprint('api', __name__)
 
 # 🌟 FLASK-MAIL CONFIGURATION 🌟
 # NOTE: REPLACE THESE WITH YOUR ACTUAL SMTP DETAILS!
-app.config['MAIL_SERVER'] = 'smtp.gmail.com' # Example for Gmail
-app.config['MAIL_PORT'] = 587
-app.config['MAIL_USE_TLS'] = True
-app.config['MAIL_USERNAME'] = 'nandhu6256@gmail.com'  # <-- REPLACE THIS
-app.config['MAIL_PASSWORD'] = 'vbckfpzlrjaxamji'     # <-- REPLACE THIS (Use an App Password!)
-app.config['MAIL_DEFAULT_SENDER'] = 'nandhu6256@gmail.com'
-
-
-mail = Mail(app)
-init_db()
+MAIL_CONFIG = {
+    'MAIL_SERVER': 'smtp.gmail.com', # Example for Gmail
+    'MAIL_PORT': 587,
+    'MAIL_USE_TLS': True,
+    'MAIL_USERNAME': 'nandhu6256@gmail.com',  # <-- REPLACE THIS
+    'MAIL_PASSWORD': 'vbckfpzlrjaxamji',     # <-- REPLACE THIS (Use an App Password!)
+    'MAIL_DEFAULT_SENDER': 'nandhu6256@gmail.com',
+}
+
+
+def create_app():
+    """
+    Application factory. Importing this module has no side effects: the schema is
+    migrated once per deploy by init_db() (gunicorn's on_starting hook, or `python app.py`),
+    not by every worker.
+    """
+    app = Flask(__name__, static_folder="../frontend/dist", static_url_path="/")
+    CORS(app)  # Allow CORS for all origins during development
+    init_responses(app)  # orjson serialization + gzip/brotli for large responses
+    app.config.update(MAIL_CONFIG)
+    app.register_blueprint(api)
+    return app
+
+
+def get_mail(app):
+    """Flask-Mail is only initialized the first time a digest is sent."""
+    if 'mail' not in app.extensions:
+        from flask_mail import Mail
+        Mail(app)
+    return app.extensions['mail']
 
 # --- Helper function for DB session ---
 def get_db():
     db = SessionLocal()
     return db
 
-# --- Define severity keywords for KPI calculation ---
-CRITICAL_KPI_KEYWORDS = [
-    '%critical%', 
-    '%vulnerability%', 
-    '%threat%', 
-    '%lawsuit%',
-    '%top 10%', 
-    '%transform%' 
-]
-# Define high-priority keywords for digest generation
-HIGH_PRIORITY_KEYWORDS = ['critical', 'vulnerability', 'threat', 'major security', 
-                          'major outage', 'lawsuit', 'acquisition', 'top 10', 'transform']
-
 # ----------------------------------------------------
 # 🌟 MAILER FUNCTIONS (Used by Scheduler and Manual Send) 🌟
 # ----------------------------------------------------
@@ -59,7 +70,7 @@ def send_async_email(app, msg):
     """Sends email asynchronously to prevent blocking the web server."""
     with app.app_context():
         try:
-            mail.send(msg)
+            get_mail(app).send(msg)
             logging.info(f"Digest email sent successfully to {msg.recipients[0]}")
         except Exception as e:
             logging.error(f"Failed to send email: {e}")
@@ -88,8 +99,9 @@ def create_digest_content(insights):
     
     return html_content + html_content_list
 
-def send_weekly_digest(recipient_email, insights_data):
+def send_weekly_digest(app, recipient_email, insights_data):
     """Initiates the sending of the email."""
+    from flask_mail import Message
     msg = Message(
         subject=f"CompeteTrack Digest: {len(insights_data)} New High-Priority Insights",
         recipients=[recipient_email],
@@ -104,7 +116,7 @@ def send_weekly_digest(recipient_email, insights_data):
 # Global state to track the last digest day sent
 LAST_DIGEST_SENT_DAY = None 
 
-def run_weekly_scheduler():
+def run_weekly_scheduler(app):
     """Checks if the digest should be sent based on the day."""
     global LAST_DIGEST_SENT_DAY
     
@@ -130,33 +142,11 @@ def run_weekly_scheduler():
                     Article.fetched_at >= seven_days_ago
                 ).all()
 
-                high_priority_insights = []
-                
-                for a in articles_query:
-                    full_text = a.title.lower() + (a.summary.lower() if a.summary else "")
-                    
-                    if any(k in full_text for k in HIGH_PRIORITY_KEYWORDS):
-                        main_summary = "Action required."
-                        category = "General"
-                        try:
-                            summary_data = json.loads(a.summary)
-                            main_summary = summary_data.get("insight") or summary_data.get("bullets", [""])[0]
-                            category = summary_data.get("tags", ["General"])[0] 
-                        except:
-                            pass 
-
-                        high_priority_insights.append({
-                            'competitor': a.competitor,
-                            'title': a.title,
-                            'summary': main_summary,
-                            'source_url': a.url,
-                            'priority': 'High Priority',
-                            'category': category
-                        })
+                high_priority_insights = collect_digest_insights(articles_query)
 
                 if high_priority_insights:
                     logging.info(f"Scheduled run triggered: sending digest with {len(high_priority_insights)} insights.")
-                    send_weekly_digest(RECIPIENT_EMAIL, high_priority_insights)
+                    send_weekly_digest(app, RECIPIENT_EMAIL, high_priority_insights)
                     LAST_DIGEST_SENT_DAY = current_day # Mark as sent
                 else:
                     logging.info("Scheduled run: No high-priority insights to send.")
@@ -176,7 +166,7 @@ def run_weekly_scheduler():
 # ----------------------------------------------------
 
 # 1️⃣ Competitor Management
-@app.route('/api/competitors', methods=['GET'])
+@api.route('/api/competitors', methods=['GET'])
 def get_competitor_details():
     db = get_db()
     try:
@@ -193,7 +183,7 @@ def get_competitor_details():
     finally:
         db.close()
 
-@app.route('/api/add-competitor', methods=['POST'])
+@api.route('/api/add-competitor', methods=['POST'])
 def add_competitor_to_db():
     db = get_db()
     data = request.get_json()
@@ -231,7 +221,7 @@ def add_competitor_to_db():
     finally:
         db.close()
 
-@app.route('/api/competitors/<string:competitor_name>', methods=['DELETE'])
+@api.route('/api/competitors/<string:competitor_name>', methods=['DELETE'])
 def delete_competitor(competitor_name):
     db = get_db()
     try:
@@ -240,7 +230,17 @@ def delete_competitor(competitor_name):
         if not competitor:
             return jsonify({'message': f'Competitor "{competitor_name}" not found.', 'status': 'error'}), 404
 
+        now = datetime.datetime.utcnow()
+        # Tombstones let open Insights pages drop the deleted cards on their next delta sync
+        db.execute(insert(ArticleTombstone).from_select(
+            ['article_id', 'deleted_at'],
+            select(Article.id, literal(now)).where(Article.competitor == competitor_name)
+        ))
+        db.query(ArticleTombstone).filter(
+            ArticleTombstone.deleted_at < now - timedelta(days=TOMBSTONE_RETENTION_DAYS)
+        ).delete(synchronize_session=False)
         db.query(Article).filter(Article.competitor == competitor_name).delete(synchronize_session=False)
+        db.query(TrendRollup).filter(TrendRollup.competitor == competitor_name).delete(synchronize_session=False)
         db.delete(competitor)
         db.commit()
 
@@ -255,8 +255,9 @@ def delete_competitor(competitor_name):
 
 
 # 2️⃣ Fetch & Summarize Articles
-@app.route('/api/fetch-and-summarize', methods=['POST'])
+@api.route('/api/fetch-and-summarize', methods=['POST'])
 def fetch_and_summarize_data():
+    from ingest import ingest_competitor
     body = request.json or {}
     name = body.get('competitor_name')
     db = get_db()
@@ -272,41 +273,11 @@ def fetch_and_summarize_data():
             "website": db_comp.website
         }
 
-        items = fetch_and_extract(comp, rss_limit=5, workers=3)
-        new_articles_count = 0
-
-        for item in items:
-            url = item.get('url')
-            if db.query(Article).filter(Article.url == url).first():
-                continue
-
-            summary_dict = {
-                "insight": item.get('insight', 'N/A'),
-                "bullets": item.get('bullets', []),
-                "tags": item.get('tags', [])
-            }
-
-            article = Article(
-                competitor=name,
-                url=url,
-                title=item.get('title'),
-                content=item.get('content'),
-                summary=json.dumps(summary_dict),
-                fetched_at=datetime.datetime.utcnow(),
-                status='pending'
-            )
-
-            try:
-                db.add(article)
-                db.commit()
-                new_articles_count += 1
-            except IntegrityError:
-                db.rollback()
-                continue
+        result = ingest_competitor(db, comp, rss_limit=5, workers=3)
 
         return jsonify({
-            'message': f"Processed {len(items)} items. Added {new_articles_count} new articles/insights for {name}.",
-            'new_articles_count': new_articles_count
+            'message': f"Processed {result['processed']} items. Added {result['new_articles']} new articles/insights for {name}.",
+            'new_articles_count': result['new_articles']
         })
         
     except Exception as e:
@@ -318,126 +289,119 @@ def fetch_and_summarize_data():
 
 
 # 3️⃣ Dashboard Feed
-@app.route('/api/dashboard-feed', methods=['GET'])
+@api.route('/api/dashboard-feed', methods=['GET'])
 def get_dashboard_feed():
     db = get_db()
     try:
         articles = db.query(Article).order_by(desc(Article.fetched_at)).limit(20).all()
-        feed_data = []
-        
-        CRITICAL_KEYWORDS = ['critical', 'vulnerability', 'threat', 'major security', 'major outage', 'lawsuit', 'acquisition', 'top 10', 'transform']
-        MEDIUM_KEYWORDS = ['launch', 'new feature', 'pricing change', 'high priority', 'review', 'guide', 'easier']
-
-        for a in articles:
-            severity = "Normal"
-            main_summary = a.summary
-            tags = ["General"]
-
-            full_text = a.title.lower()
-            
-            try:
-                summary_data = json.loads(a.summary)
-                main_summary = summary_data.get("insight") or summary_data.get("bullets", [""])[0]
-                tags = summary_data.get("tags", ["General"])
-                
-                full_text += " " + main_summary.lower()
-                normalized_tags = [t.lower().strip() for t in tags]
-                full_text += " " + " ".join(normalized_tags) 
-                
-            except Exception as e:
-                logging.warning(f"Summary for article ID {a.id} is not valid JSON. Using raw summary. Error: {e}")
-                full_text += " " + a.summary.lower()
-                tags = ["Parsing Error"]
-
-            # SEVERITY DETERMINATION
-            if any(k in full_text for k in CRITICAL_KEYWORDS):
-                severity = "Critical"
-            elif any(k in full_text for k in MEDIUM_KEYWORDS):
-                severity = "Medium"
-            
-            if "Parsing Error" in tags:
-                severity = "Error"
-            
-            feed_data.append({
-                "id": a.id,
-                "competitor": a.competitor,
-                "time_ago": a.fetched_at.strftime('%Y-%m-%d %H:%M'),
-                "title": a.title,
-                "summary": main_summary,
-                "tags": tags,
-                "source_url": a.url,
-                "status": a.status,
-                "severity": severity
-            })
+        feed_data = [classify_feed_article(a) for a in articles]
         return jsonify(feed_data)
     finally:
         db.close()
 
 
 # 4️⃣ Insights Page (FIXED CATEGORY LOGIC)
-@app.route('/api/insights', methods=['GET'])
+BATCH_STATUS_MAX_IDS = 500   # Upper bound on ids per batch status request
+SYNC_OVERLAP_SECONDS = 30    # updated_since is moved back this much: a row's updated_at is set at
+                             # flush but only visible at commit, possibly after a cursor taken in between
+TOMBSTONE_RETENTION_DAYS = 7 # Older cursors may have missed pruned tombstones and get reset=true
+
+
+# Per-worker memo of article id -> (updated_at, is high priority). Priority only depends on
+# title/summary and every ORM update bumps updated_at, so unchanged rows are never re-classified.
+_HIGH_PRIORITY_CACHE = {}
+_KPI_FETCH_CHUNK = 500
+
+
+def count_high_priority(db) -> int:
+    """Number of open insights classified High Priority (same rule as the insights list)."""
+    global _HIGH_PRIORITY_CACHE
+    open_rows = db.execute(
+        select(Article.id, Article.updated_at).where(Article.status.in_(INSIGHT_STATUSES))
+    ).all()
+    # Rebuilt from the open rows each time, so resolved/deleted articles drop out of the memo
+    cache = {i: _HIGH_PRIORITY_CACHE[i] for i, ts in open_rows
+             if i in _HIGH_PRIORITY_CACHE and _HIGH_PRIORITY_CACHE[i][0] == ts}
+    stale = [i for i, _ in open_rows if i not in cache]
+    columns = (Article.id, Article.competitor, Article.title, Article.summary, Article.status, Article.updated_at)
+    if len(stale) > _KPI_FETCH_CHUNK * 4:
+        # Cold memo (new worker): one scan beats many IN (...) lookups
+        batches = [db.execute(select(*columns).where(Article.status.in_(INSIGHT_STATUSES))
+                              .execution_options(yield_per=5000))]
+    else:
+        batches = (db.execute(select(*columns).where(Article.id.in_(stale[start:start + _KPI_FETCH_CHUNK])))
+                   for start in range(0, len(stale), _KPI_FETCH_CHUNK))
+    for rows in batches:
+        for a in rows:
+            cache[a.id] = (a.updated_at, classify_insight_article(a)["priority"] == "High Priority")
+    _HIGH_PRIORITY_CACHE = cache
+    return sum(1 for i, _ in open_rows if i in cache and cache[i][1])
+
+
+def compute_insight_kpis(db) -> dict:
+    """Insights page KPI counters, without building the insights list."""
+    return {
+        "pending_actions": db.query(Article).filter(Article.status == 'pending').count(),
+        "high_priority": count_high_priority(db),
+        "total_insights": db.query(Article).count()
+    }
+
+
+def insights_delta(articles) -> dict:
+    """Splits changed articles into insight entries still on the page and ids that left it."""
+    return {
+        "insights": [classify_insight_article(a) for a in articles if a.status in INSIGHT_STATUSES],
+        "removed": [a.id for a in articles if a.status not in INSIGHT_STATUSES],
+    }
+
+
+@api.route('/api/insights', methods=['GET'])
 def get_insights():
+    """
+    Open insights plus KPIs. With ?updated_since=<server_time of a previous response> only the
+    articles changed since then are returned: `insights` to upsert and `removed` ids to drop
+    (including deleted articles). Rows near the cursor may be sent twice; upserts are idempotent.
+    `reset: true` means the cursor is too old to sync from and the client must reload in full.
+    """
     db = get_db()
-    
-    # Use the shared HIGH_PRIORITY_KEYWORDS
-    
+    # Taken before querying: a row changed mid-request is sent again next time rather than missed
+    server_time = datetime.datetime.utcnow()
+
     try:
+        if request.args.get('updated_since'):
+            try:
+                since = parse_utc_datetime(request.args['updated_since'])
+            except ValueError:
+                return jsonify({'error': 'updated_since must be an ISO datetime.'}), 400
+
+            if since < server_time - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+                return jsonify({"reset": True, "server_time": server_time.isoformat()})
+
+            since -= timedelta(seconds=SYNC_OVERLAP_SECONDS)
+            changed = db.query(Article).filter(Article.updated_at > since).order_by(desc(Article.fetched_at)).all()
+            delta = insights_delta(changed)
+            live_ids = {a.id for a in changed}
+            deleted_ids = {
+                a_id for (a_id,) in db.query(ArticleTombstone.article_id).filter(ArticleTombstone.deleted_at > since)
+            }
+            # An id reused by a newer row (SQLite) is an upsert, not a removal
+            delta["removed"] += sorted(deleted_ids - live_ids)
+            return jsonify({
+                **delta,
+                "reset": False,
+                "kpis": compute_insight_kpis(db),
+                "server_time": server_time.isoformat()
+            })
+
         articles_as_insights = db.query(Article).filter(
-            Article.status.in_(['pending', 'actioned_note_added'])
+            Article.status.in_(INSIGHT_STATUSES)
         ).order_by(desc(Article.fetched_at)).all()
         
-        insights_data = []
-        high_priority_count = 0
-
-        # 🌟 CATEGORY FIX: Define generic tags to ignore 🌟
-        GENERIC_TAGS = ['general', 'product', 'pricing', 'update', 'launch', 'feature', 'review', 'analysis', 'tech', 'saas', 'ai']
-        
-        for a in articles_as_insights:
-            priority = "Medium Priority"
-            category = "General"
-            competitor_name = a.competitor
-
-            full_text = a.title.lower()
-            main_summary = "No actionable insight provided."
-            insight_tags = []
-
-            try:
-                summary = json.loads(a.summary)
-                main_summary = summary.get("insight") or summary.get("bullets", [""])[0]
-                insight_tags = summary.get("tags", [])
-                
-                full_text += " " + main_summary.lower()
-                normalized_tags = [t.lower().strip() for t in insight_tags]
-                full_text += " " + " ".join(normalized_tags) 
-                
-                # Find the first tag that is NOT generic to use as the main Category
-                specific_category = next(
-                    (t for t in normalized_tags if t not in GENERIC_TAGS and t), 
-                    "General" 
-                )
-                category = specific_category.title()
-
-            except Exception:
-                full_text += " " + a.summary.lower()
-                insight_tags = ["Parsing Error"]
-                category = "Parsing Error"
-
-            # Determine Priority
-            if any(k in full_text for k in HIGH_PRIORITY_KEYWORDS):
-                priority = "High Priority"
-                high_priority_count += 1
-            
-            insights_data.append({
-                "id": a.id,
-                "competitor": competitor_name,
-                "title": a.title,
-                "summary": main_summary,
-                "category": category,
-                "priority": priority,
-                "status": a.status,
-                "action_notes": None,
-                "tags": insight_tags
-            })
+        insights_data = [classify_insight_article(a) for a in articles_as_insights]
+        high_priority_count = sum(1 for i in insights_data if i["priority"] == "High Priority")
+        # Seeds the KPI memo so the batch status/delta calls that follow start warm
+        for a, i in zip(articles_as_insights, insights_data):
+            _HIGH_PRIORITY_CACHE[a.id] = (a.updated_at, i["priority"] == "High Priority")
             
         # KPI Counts
         total_pending = db.query(Article).filter(Article.status == 'pending').count()
@@ -448,12 +412,56 @@ def get_insights():
                 "pending_actions": total_pending,
                 "high_priority": high_priority_count,
                 "total_insights": db.query(Article).count()
-            }
+            },
+            "server_time": server_time.isoformat()
         })
     finally:
         db.close()
 
-@app.route('/api/insights/<int:article_id>/status', methods=['PUT'])
+@api.route('/api/insights/status', methods=['POST'])
+def update_insight_statuses():
+    """
+    Sets one status on many insights in a single transaction.
+    Body: {"ids": [1, 2, ...], "status": "actioned"}. Returns the same delta shape as
+    /api/insights?updated_since= (changed rows + refreshed KPIs), so the client never reloads.
+    No server_time: the client's sync cursor must keep coming from GET /api/insights.
+    """
+    data = request.get_json(silent=True) or {}
+    ids = data.get('ids')
+    new_status = data.get('status')
+
+    if not isinstance(new_status, str) or not new_status.strip():
+        return jsonify({'error': 'status is required.'}), 400
+    if (not isinstance(ids, list) or not ids or len(ids) > BATCH_STATUS_MAX_IDS
+            or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids)):
+        return jsonify({'error': f'ids must be a list of 1 to {BATCH_STATUS_MAX_IDS} integers.'}), 400
+
+    ids = list(dict.fromkeys(ids))
+    new_status = new_status.strip()
+    db = get_db()
+    try:
+        articles = db.query(Article).filter(Article.id.in_(ids)).all()
+        changed = [a for a in articles if a.status != new_status]
+        unchanged = [a.id for a in articles if a.status == new_status]
+        for a in changed:
+            a.status = new_status
+        delta = insights_delta(changed)   # Built before commit() expires the loaded rows
+        db.commit()
+
+        found = {a.id for a in articles}
+        return jsonify({
+            **delta,
+            "unchanged": unchanged,
+            "not_found": [i for i in ids if i not in found],
+            "kpis": compute_insight_kpis(db)
+        }), 200
+    except Exception as e:
+        db.rollback()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
+@api.route('/api/insights/<int:article_id>/status', methods=['PUT'])
 def update_insight_status(article_id):
     db = get_db()
     data = request.get_json()
@@ -473,7 +481,7 @@ def update_insight_status(article_id):
         db.close()
 
 # 5️⃣ KPI Data
-@app.route('/api/dashboard/kpis', methods=['GET'])
+@api.route('/api/dashboard/kpis', methods=['GET'])
 def get_kpis():
     db = get_db()
     try:
@@ -499,7 +507,7 @@ def get_kpis():
         db.close()
 
 # 6️⃣ Manual Digest Send Endpoint
-@app.route('/api/send-digest-now', methods=['POST'])
+@api.route('/api/send-digest-now', methods=['POST'])
 def send_digest_now():
     """Immediately triggers the digest generation and sends the email."""
     
@@ -514,33 +522,11 @@ def send_digest_now():
             Article.fetched_at >= seven_days_ago
         ).all()
 
-        high_priority_insights = []
-        
-        for a in articles_query:
-            full_text = a.title.lower() + (a.summary.lower() if a.summary else "")
-            
-            if any(k in full_text for k in HIGH_PRIORITY_KEYWORDS):
-                main_summary = "Action required."
-                category = "General"
-                try:
-                    summary_data = json.loads(a.summary)
-                    main_summary = summary_data.get("insight") or summary_data.get("bullets", [""])[0]
-                    category = summary_data.get("tags", ["General"])[0] 
-                except:
-                    pass 
-
-                high_priority_insights.append({
-                    'competitor': a.competitor,
-                    'title': a.title,
-                    'summary': main_summary,
-                    'source_url': a.url,
-                    'priority': 'High Priority',
-                    'category': category
-                })
+        high_priority_insights = collect_digest_insights(articles_query)
 
         if high_priority_insights:
             logging.info(f"Manual send initiated: sending digest with {len(high_priority_insights)} insights to {RECIPIENT_EMAIL}.")
-            send_weekly_digest(RECIPIENT_EMAIL, high_priority_insights)
+            send_weekly_digest(current_app._get_current_object(), RECIPIENT_EMAIL, high_priority_insights)
             
             return jsonify({
                 "message": f"Digest initiated. Check your inbox ({RECIPIENT_EMAIL}) soon.",
@@ -559,6 +545,84 @@ def send_digest_now():
         db.close()
 
 
+# 7️⃣ Source Health (Circuit Breaker Status)
+@api.route('/api/sources/health', methods=['GET'])
+def get_source_health():
+    """
+    Lists hosts with open/half-open breakers or recent failures (?all=1 lists every host),
+    as published by the processes that fetch, so every worker gives the same answer.
+    """
+    from source_health import published_snapshot
+    show_all = request.args.get('all') in ('1', 'true')
+    db = get_db()
+    try:
+        hosts = published_snapshot(db, unhealthy_only=not show_all)
+    finally:
+        db.close()
+    return jsonify({
+        "unhealthy_count": sum(1 for h in hosts if h["state"] != "closed"),
+        "hosts": hosts
+    })
+
+# 8️⃣ Trends (Served from Precomputed Rollups)
+@api.route('/api/trends', methods=['GET'])
+def get_trends():
+    """
+    Article counts over a date range from the trend rollups.
+    Query params: start, end (YYYY-MM-DD, default last 30 days), interval (day|week),
+    group_by (comma-separated: competitor, category, severity), and equality filters
+    competitor / category / severity.
+    """
+    try:
+        today = datetime.datetime.utcnow().date()
+        end = datetime.date.fromisoformat(request.args['end']) if request.args.get('end') else today
+        start = (datetime.date.fromisoformat(request.args['start']) if request.args.get('start')
+                 else end - timedelta(days=DEFAULT_RANGE_DAYS - 1))
+    except ValueError:
+        return jsonify({'error': 'start/end must be dates in YYYY-MM-DD format.'}), 400
+
+    interval = request.args.get('interval', 'day')
+    group_by = [g.strip() for g in request.args.get('group_by', 'competitor').split(',') if g.strip()]
+    if interval not in ('day', 'week') or any(g not in ROLLUP_DIMENSIONS for g in group_by):
+        return jsonify({'error': f'interval must be day|week; group_by must be a subset of {list(ROLLUP_DIMENSIONS)}.'}), 400
+    if start > end or (end - start).days > MAX_RANGE_DAYS:
+        return jsonify({'error': 'Invalid date range.'}), 400
+
+    filters = {d: request.args[d] for d in ROLLUP_DIMENSIONS if request.args.get(d)}
+
+    db = get_db()
+    try:
+        result = query_trends(db, start, end, group_by, interval, filters)
+        return jsonify({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "interval": interval,
+            "group_by": group_by,
+            **result
+        })
+    finally:
+        db.close()
+
+# 9️⃣ Bulk Export (Streamed NDJSON / CSV)
+@api.route('/api/export/<string:kind>', methods=['GET'])
+def export_data(kind):
+    """
+    Streams every matching article/insight in id order without loading them all in memory.
+    Query params: format (ndjson|csv), competitor, status, since, until, after_id, limit,
+    include_content (articles only). See export.parse_export_params.
+    """
+    try:
+        params = parse_export_params(kind, request.args)
+    except ExportParamError as e:
+        return jsonify({'error': str(e)}), 400
+
+    filename = f"{kind}-{datetime.datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.{params['format']}"
+    return current_app.response_class(
+        stream_export(params),
+        mimetype=EXPORT_FORMATS[params['format']],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
 # --- Initialize default competitors ---
 def initialize_default_competitors():
     db = get_db()
@@ -579,17 +643,35 @@ def initialize_default_competitors():
     finally:
         db.close()
 
+# --- Background Tasks (Digest + Feed Polling) ---
+def _start_leader_threads(app):
+    from scheduler import FeedScheduler
+    from ingest import run_summary_upgrader
+
+    Thread(target=run_weekly_scheduler, args=(app,), daemon=True, name="weekly-digest").start()
+    Thread(target=FeedScheduler().run_forever, daemon=True, name="feed-poller").start()
+    Thread(target=run_summary_upgrader, daemon=True, name="summary-upgrader").start()
+
+def start_background_tasks(app):
+    """
+    Starts the weekly digest, feed polling and summary upgrade threads in exactly one process,
+    even when gunicorn runs several workers (see gunicorn.conf.py). The other workers stay on standby.
+    """
+    from leader import run_as_leader
+    run_as_leader(lambda: _start_leader_threads(app))
+
 # --- Run Flask App ---
 def run_app():
-    """Starts the scheduler thread and runs the Flask application."""
-    # Start the scheduler in a separate thread
-    scheduler_thread = Thread(target=run_weekly_scheduler)
-    scheduler_thread.daemon = True 
-    scheduler_thread.start()
+    """Migrates the schema, starts the background tasks and runs the Flask application."""
+    from models import init_db
+    init_db()
+    initialize_default_competitors()
+
+    app = create_app()
+    start_background_tasks(app)
     
     # use_reloader=False is crucial when starting threads
     app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False) 
 
 if __name__ == '__main__':
-    initialize_default_competitors()
-    run_app()
\ No newline at end of file
+    run_app()
@@ -0,0 +1,140 @@
+# backend/benchmarks/compression.py
+
+"""
+Prompt pre-compression benchmark: summary latency and output agreement of
+compressed prompts (summarizer.PROMPT_TOKEN_BUDGET) against the full-text
+prompt (text[:15000]).
+
+Against a real Ollama and real stored articles (from backend/):
+    python -m benchmarks.compression --live --limit 25 --budgets 500,1000,2000
+
+Without --live, synthetic pages and the stub LLM are used; latency then follows
+--llm-latency-per-kchar and the agreement numbers are not meaningful.
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _words(summary: dict) -> list:
+    parts = [summary.get("insight") or ""] + [str(b) for b in summary.get("bullets") or []]
+    return _WORD.findall(" ".join(parts).lower())
+
+
+def unigram_f1(reference: dict, candidate: dict) -> float:
+    """ROUGE-1 style F1 between the bullet+insight words of two summaries."""
+    ref, cand = _words(reference), _words(candidate)
+    if not ref or not cand:
+        return 0.0
+    ref_counts, overlap = {}, 0
+    for w in ref:
+        ref_counts[w] = ref_counts.get(w, 0) + 1
+    for w in cand:
+        if ref_counts.get(w, 0) > 0:
+            ref_counts[w] -= 1
+            overlap += 1
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / len(cand), overlap / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def tag_jaccard(reference: dict, candidate: dict) -> float:
+    a = {str(t).lower().strip() for t in reference.get("tags") or []}
+    b = {str(t).lower().strip() for t in candidate.get("tags") or []}
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def load_texts(live: bool, limit: int) -> list:
+    if live:
+        from models import SessionLocal, Article
+        from sqlalchemy import func
+        db = SessionLocal()
+        try:
+            rows = db.query(Article.content).filter(func.length(Article.content) > 2000).limit(limit).all()
+            return [r[0] for r in rows]
+        finally:
+            db.close()
+
+    from fetcher import extract_text_from_url
+    return [extract_text_from_url(f"https://bench.invalid/compression/{i}") for i in range(limit)]
+
+
+def run_compression(texts: list, budgets: list) -> dict:
+    import summarizer
+    from extractive import compress_text
+
+    original_budget = summarizer.PROMPT_TOKEN_BUDGET
+    results = {}
+    try:
+        summarizer.PROMPT_TOKEN_BUDGET = 0
+        full = []
+        for text in texts:
+            started = time.perf_counter()
+            full.append((summarizer.summarize_text(text), time.perf_counter() - started))
+        results["full_text"] = {
+            "median_latency_ms": round(statistics.median(t for _, t in full) * 1000, 2),
+            "mean_prompt_chars": round(statistics.fmean(len(t[:15000]) for t in texts)),
+        }
+
+        for budget in budgets:
+            summarizer.PROMPT_TOKEN_BUDGET = budget
+            latencies, compress_ms, chars, f1s, jaccards = [], [], [], [], []
+            for text, (reference, _) in zip(texts, full):
+                started = time.perf_counter()
+                chars.append(len(compress_text(text, budget)))
+                compress_ms.append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                candidate = summarizer.summarize_text(text)
+                latencies.append(time.perf_counter() - started)
+                f1s.append(unigram_f1(reference, candidate))
+                jaccards.append(tag_jaccard(reference, candidate))
+
+            results[f"budget_{budget}"] = {
+                "median_latency_ms": round(statistics.median(latencies) * 1000, 2),
+                "latency_vs_full": round(statistics.median(latencies) / max(statistics.median(t for _, t in full), 1e-9), 3),
+                "median_compress_ms": round(statistics.median(compress_ms), 3),
+                "mean_prompt_chars": round(statistics.fmean(chars)),
+                "mean_unigram_f1_vs_full": round(statistics.fmean(f1s), 3),
+                "mean_tag_jaccard_vs_full": round(statistics.fmean(jaccards), 3),
+            }
+    finally:
+        summarizer.PROMPT_TOKEN_BUDGET = original_budget
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt pre-compression.")
+    parser.add_argument("--live", action="store_true", help="Use the real Ollama and stored article content.")
+    parser.add_argument("--limit", type=int, default=20, help="Number of articles.")
+    parser.add_argument("--budgets", default="500,1000,2000", help="Comma-separated token budgets.")
+    parser.add_argument("--llm-latency-per-kchar", type=float, default=0.05, help="Stub LLM cost per 1k prompt chars (s).")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file.")
+    args = parser.parse_args()
+
+    if not args.live:
+        from benchmarks.stubs import install_stubs
+        install_stubs(llm_latency_per_kchar=args.llm_latency_per_kchar)
+
+    texts = load_texts(args.live, args.limit)
+    if not texts:
+        raise SystemExit("No article content to benchmark (need articles with > 2000 chars of content).")
+
+    budgets = [int(b) for b in args.budgets.split(",") if b.strip()]
+    report = {"live": args.live, "articles": len(texts), "results": run_compression(texts, budgets)}
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# backend/benchmarks/datagen.py
+
+"""
+Synthetic data generator: replaces the contents of `competitors` and `articles` with
+realistic rows. It wipes the target database, so the target must be named explicitly.
+
+Usage (from backend/):
+    python -m benchmarks.datagen --db bench.db --rows 100000
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.datagen --rows 100000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import time
+
+from benchmarks.stubs import SENTENCES, TAGS, build_summary
+
+COMPETITOR_NAMES = [
+    "TechCrunch", "The Verge", "VentureBeat AI", "Acme AI", "Globex Cloud", "Initech Labs",
+    "Umbrella Analytics", "Hooli", "Stark Data", "Wayne Systems", "Cyberdyne", "Soylent SaaS",
+]
+
+TITLE_TEMPLATES = [
+    "{c} announces new feature for enterprise teams",
+    "{c} pricing change rattles the market",
+    "Critical vulnerability found in {c} platform",
+    "{c} completes acquisition of analytics startup",
+    "Hands-on review: is {c} worth the upgrade?",
+    "{c} faces lawsuit over training data",
+    "A guide to the latest {c} launch",
+    "{c} named in top 10 fastest growing AI companies",
+    "{c} quarterly results beat expectations",
+    "What the {c} roadmap means for developers",
+]
+
+# Approximate status mix seen in a triaged backlog
+STATUSES = ["pending"] * 14 + ["actioned"] * 5 + ["actioned_note_added"]
+
+# Share of rows whose summary is raw model output rather than JSON ("Parsing Error" path)
+INVALID_SUMMARY_RATE = 0.02
+
+BATCH_SIZE = 10000
+
+
+def generate(rows: int, competitors: int = 12, seed: int = 42, days: int = 180) -> dict:
+    """Inserts `competitors` Competitor rows and `rows` Article rows (plus their trend rollups). Returns timing info."""
+    from models import (
+        init_db, engine, SessionLocal, Article, ArticleTombstone, Competitor, SummaryUpgrade, TrendRollup,
+        CachedPage, SourceHealth
+    )
+    from trends import rebuild_rollups
+
+    rng = random.Random(seed)
+    names = COMPETITOR_NAMES[:competitors] + [f"Competitor {i}" for i in range(len(COMPETITOR_NAMES), competitors)]
+    now = datetime.datetime.utcnow()
+
+    started = time.perf_counter()
+    init_db()
+
+    with engine.begin() as conn:
+        conn.execute(SummaryUpgrade.__table__.delete())
+        conn.execute(ArticleTombstone.__table__.delete())   # Stale tombstones would match reused ids
+        conn.execute(SourceHealth.__table__.delete())
+        conn.execute(CachedPage.__table__.delete())
+        conn.execute(TrendRollup.__table__.delete())
+        conn.execute(Article.__table__.delete())
+        conn.execute(Competitor.__table__.delete())
+        conn.execute(Competitor.__table__.insert(), [{
+            "name": name,
+            "website": f"https://{name.lower().replace(' ', '')}.example.com",
+            "rss": f"https://{name.lower().replace(' ', '')}.example.com/feed",
+            "description": "Synthetic benchmark competitor",
+            "created_at": now,
+        } for name in names])
+
+        batch = []
+        for i in range(rows):
+            name = rng.choice(names)
+            if rng.random() < INVALID_SUMMARY_RATE:
+                summary = " ".join(rng.sample(SENTENCES, 2)) + " ..."
+            else:
+                summary = json.dumps(build_summary(rng))
+            fetched_at = now - datetime.timedelta(seconds=rng.randint(0, days * 86400))
+            batch.append({
+                "competitor": name,
+                "url": f"https://{name.lower().replace(' ', '')}.example.com/articles/{i}",
+                "title": rng.choice(TITLE_TEMPLATES).format(c=name),
+                "published": fetched_at - datetime.timedelta(hours=rng.randint(0, 48)),
+                "content": "\n".join(rng.sample(SENTENCES, 6)),
+                "summary": summary,
+                "status": rng.choice(STATUSES),
+                "fetched_at": fetched_at,
+            })
+            if len(batch) >= BATCH_SIZE:
+                conn.execute(Article.__table__.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(Article.__table__.insert(), batch)
+
+    elapsed = time.perf_counter() - started
+
+    # Trend rollups are normally maintained at ingest; backfill them for the bulk-loaded rows
+    rollup_started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db)
+    finally:
+        db.close()
+    rollup_seconds = time.perf_counter() - rollup_started
+
+    return {
+        "rows": rows,
+        "competitors": len(names),
+        "tags": len(TAGS),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        "rollup_rebuild_seconds": round(rollup_seconds, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replace the database contents with synthetic articles.")
+    parser.add_argument("--db", default=None, help="Scratch SQLite file (or set DATABASE_URL).")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of articles (10k to 1M).")
+    parser.add_argument("--competitors", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--days", type=int, default=180, help="Spread fetched_at over this many days.")
+    args = parser.parse_args()
+    # Never default to the app's own database: generate() deletes every article in the target
+    if args.db:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.db)}"
+    elif not os.environ.get("DATABASE_URL"):
+        parser.error("pass --db <scratch file> or set DATABASE_URL; this wipes the target database")
+    print(json.dumps(generate(args.rows, args.competitors, args.seed, args.days), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# backend/benchmarks/load.py
+
+"""
+Concurrent HTTP load test of the Flask endpoints.
+
+The app is served by werkzeug's threaded server on an ephemeral port in this
+process; a pool of client threads (one requests.Session each) hammers each
+endpoint for a fixed duration at every concurrency level.
+"""
+
+import datetime
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from werkzeug.serving import make_server
+
+from benchmarks.timing import percentile
+
+# Last 365 days: covers datagen's default 180-day spread and stays inside the endpoint's MAX_RANGE_DAYS
+TRENDS_START = (datetime.datetime.utcnow().date() - datetime.timedelta(days=364)).isoformat()
+
+# (name, method, path, json body) — the write endpoint runs against the network/Ollama stubs
+ENDPOINTS = [
+    ("competitors", "GET", "/api/competitors", None),
+    ("dashboard_feed", "GET", "/api/dashboard-feed", None),
+    ("dashboard_kpis", "GET", "/api/dashboard/kpis", None),
+    ("insights", "GET", "/api/insights", None),
+    ("trends", "GET", f"/api/trends?start={TRENDS_START}&group_by=competitor,category&interval=week", None),
+    ("export_ndjson", "GET", "/api/export/articles?limit=1000", None),
+    ("fetch_and_summarize", "POST", "/api/fetch-and-summarize", {"competitor_name": "TechCrunch"}),
+]
+
+
+class _ServerThread(threading.Thread):
+    def __init__(self, flask_app):
+        super().__init__(daemon=True)
+        self.server = make_server("127.0.0.1", 0, flask_app, threaded=True)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def run(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        self.server.shutdown()
+
+
+def _worker(base_url, method, path, body, deadline):
+    latencies, errors, bytes_in = [], 0, 0
+    session = requests.Session()
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            r = session.request(method, base_url + path, json=body, timeout=120)
+            # Wire size (compressed when the server negotiated an encoding)
+            bytes_in += int(r.headers.get("Content-Length") or len(r.content))
+            if r.status_code >= 400:
+                errors += 1
+        except requests.exceptions.RequestException:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    session.close()
+    return latencies, errors, bytes_in
+
+
+def run_load(concurrency=(1, 8, 32), duration: float = 10.0, endpoints=None) -> dict:
+    from app import create_app
+    flask_app = create_app()
+
+    # Per-request access logs would dominate the output
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    selected = [e for e in ENDPOINTS if not endpoints or e[0] in endpoints]
+    server = _ServerThread(flask_app)
+    server.start()
+    results = {}
+    try:
+        for name, method, path, body in selected:
+            results[name] = {}
+            for level in concurrency:
+                deadline = time.perf_counter() + duration
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=level) as ex:
+                    futures = [ex.submit(_worker, server.base_url, method, path, body, deadline) for _ in range(level)]
+                    outcomes = [f.result() for f in futures]
+                wall = time.perf_counter() - started
+
+                latencies = [l * 1000.0 for lat, _, _ in outcomes for l in lat]
+                errors = sum(e for _, e, _ in outcomes)
+                bytes_in = sum(b for _, _, b in outcomes)
+                count = len(latencies)
+                results[name][str(level)] = {
+                    "requests": count,
+                    "errors": errors,
+                    "requests_per_second": round(count / wall, 2) if wall else None,
+                    "p50_ms": round(percentile(latencies, 50), 3),
+                    "p95_ms": round(percentile(latencies, 95), 3),
+                    "p99_ms": round(percentile(latencies, 99), 3),
+                    "bytes_per_response": round(bytes_in / count, 1) if count else 0,
+                }
+    finally:
+        server.stop()
+    return results
@@ -0,0 +1,83 @@
+# backend/benchmarks/micro.py
+
+"""
+Micro-benchmarks for the CPU-bound hot paths:
+  * the classification loops behind /api/dashboard-feed and /api/insights
+  * extract_text_from_url() (against a stubbed HTTP response)
+  * extractive prompt pre-compression (compress_text) and the local summarizer tier
+  * the weekly digest builder (collect_digest_insights + create_digest_content)
+"""
+
+import datetime
+import itertools
+import logging
+import random
+
+from benchmarks.timing import measure
+
+
+def run_micro(sample: int = 20000, repeat: int = 5) -> dict:
+    import app as app_module
+    from classifier import classify_feed_article, classify_insight_article, collect_digest_insights
+    from fetcher import extract_text_from_url
+    from extractive import compress_text
+    from summarizer import PROMPT_TOKEN_BUDGET, summarize_locally
+    from models import SessionLocal, Article
+    from sqlalchemy import desc
+
+    # Invalid summaries log a warning per row in the feed loop; keep the log out of the timing
+    logging.getLogger().setLevel(logging.ERROR)
+
+    results = {}
+    db = SessionLocal()
+    try:
+        articles = db.query(Article).order_by(desc(Article.fetched_at)).limit(sample).all()
+        # Detach so attribute access in the loops does not hit the session
+        db.expunge_all()
+
+        insight_rows = [a for a in articles if a.status in ('pending', 'actioned_note_added')]
+        week_ago = datetime.datetime.utcnow() - datetime.timedelta(days=7)
+        digest_rows = [a for a in articles if a.fetched_at >= week_ago]
+
+        n = max(len(articles), 1)
+        feed = measure(lambda: [classify_feed_article(a) for a in articles], repeat=repeat)
+        feed["articles"] = len(articles)
+        feed["us_per_article"] = round(feed["median_ms"] * 1000.0 / n, 3)
+        results["classify_feed"] = feed
+
+        n = max(len(insight_rows), 1)
+        insights = measure(lambda: [classify_insight_article(a) for a in insight_rows], repeat=repeat)
+        insights["articles"] = len(insight_rows)
+        insights["us_per_article"] = round(insights["median_ms"] * 1000.0 / n, 3)
+        results["classify_insights"] = insights
+
+        def build_digest():
+            return app_module.create_digest_content(collect_digest_insights(digest_rows))
+
+        digest = measure(build_digest, repeat=repeat)
+        digest["articles"] = len(digest_rows)
+        digest["html_bytes"] = len(build_digest().encode("utf-8"))
+        results["digest_builder"] = digest
+    finally:
+        db.close()
+
+    rng = random.Random(1)
+    urls = [f"https://bench.invalid/page/{rng.randint(0, 10**9)}" for _ in range(50)]
+    it = itertools.cycle(urls)
+    extract = measure(lambda: extract_text_from_url(next(it)), repeat=repeat * 4)
+    extract["chars_extracted"] = len(extract_text_from_url(urls[0]))
+    results["extract_text_from_url"] = extract
+
+    # Long article-like text (few repeated sentences) so there is something to cut
+    text = "\n".join(db_row.content for db_row in articles[:40] if db_row.content)
+    budget = PROMPT_TOKEN_BUDGET or 1000
+    compress = measure(lambda: compress_text(text, budget), repeat=repeat * 4)
+    compress["input_chars"] = len(text)
+    compress["output_chars"] = len(compress_text(text, budget))
+    results["compress_text"] = compress
+
+    local = measure(lambda: summarize_locally(text), repeat=repeat * 4)
+    local["input_chars"] = len(text)
+    results["summarize_locally"] = local
+
+    return results
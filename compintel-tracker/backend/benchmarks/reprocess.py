@@ -0,0 +1,47 @@
+# backend/benchmarks/reprocess.py
+
+"""
+Throughput of reprocess.py over the raw page cache: the newest `articles` rows get a
+synthetic cached page, then extraction (and extraction + local summarization) is re-run
+across the worker pool. Runs as a dry run so the scratch database is left unchanged.
+"""
+
+import random
+import time
+
+from benchmarks.stubs import build_article_html
+
+CACHE_MAX_BYTES = 1024 * 1024 * 1024   # install_stubs() turns the cache off; enabled here for the fill only
+
+
+def run_reprocess(articles: int = 2000, workers: int = None) -> dict:
+    import page_cache
+    from models import SessionLocal, Article
+    from reprocess import reprocess_articles
+
+    db = SessionLocal()
+    try:
+        rows = db.query(Article.url, Article.title).order_by(Article.id.desc()).limit(articles).all()
+    finally:
+        db.close()
+
+    rng = random.Random(3)
+    max_bytes, page_cache.PAGE_CACHE_MAX_BYTES = page_cache.PAGE_CACHE_MAX_BYTES, CACHE_MAX_BYTES
+    started = time.perf_counter()
+    try:
+        for url, title in rows:
+            page_cache.store_page(url, build_article_html(title, rng).encode("utf-8"), "text/html; charset=utf-8", "utf-8")
+    finally:
+        page_cache.PAGE_CACHE_MAX_BYTES = max_bytes
+    results = {"cache_fill_seconds": round(time.perf_counter() - started, 3), "articles": len(rows)}
+
+    for name, summarize in (("extract", None), ("extract_and_summarize_local", "local")):
+        started = time.perf_counter()
+        stats = reprocess_articles(extract=True, summarize=summarize, workers=workers, dry_run=True)
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "seconds": round(elapsed, 3),
+            "articles_per_second": round(stats["processed"] / elapsed, 1) if elapsed else 0,
+            **stats,
+        }
+    return results
@@ -0,0 +1,152 @@
+# backend/benchmarks/run.py
+
+"""
+Benchmark harness entry point. Run from backend/:
+
+    python -m benchmarks.run --rows 100000 --output benchmarks/results/latest.json
+    python -m benchmarks.run --rows 100000 --baseline benchmarks/results/main.json
+
+Builds a scratch database with synthetic data, installs the network/Ollama stubs,
+runs the startup, micro, load and page-cache reprocessing benchmarks, and writes
+everything to a JSON file. With --baseline, timings that got slower than the tolerance are reported and
+the process exits non-zero so CI can flag the regression.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Metrics where a larger value means slower
+REGRESSION_KEYS = ("median_ms", "p95_ms", "p50_ms", "us_per_article")
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def _flatten(prefix, node, out):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _flatten(f"{prefix}.{key}" if prefix else key, value, out)
+    elif isinstance(node, (int, float)):
+        out[prefix] = node
+    return out
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Returns (metric, baseline, current, ratio) for every timing that regressed past `tolerance`."""
+    now = _flatten("", current.get("results", {}), {})
+    before = _flatten("", baseline.get("results", {}), {})
+    regressions = []
+    for key, value in now.items():
+        if not key.endswith(REGRESSION_KEYS) or key not in before or not before[key]:
+            continue
+        ratio = value / before[key]
+        if ratio > 1.0 + tolerance:
+            regressions.append((key, before[key], value, round(ratio, 3)))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CompeteTrack backend benchmarks.")
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic articles to generate (10k to 1M).")
+    parser.add_argument("--db", default=os.path.join(RESULTS_DIR, "bench.db"), help="Scratch SQLite file.")
+    parser.add_argument("--reuse-db", action="store_true", help="Skip data generation and reuse --db as is.")
+    parser.add_argument("--sample", type=int, default=20000, help="Articles loaded for the micro-benchmarks.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per endpoint per concurrency level.")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated client thread counts.")
+    parser.add_argument("--endpoints", default="", help="Comma-separated subset of load-test endpoints.")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Simulated article download latency (s).")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated Ollama latency (s).")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-load", action="store_true")
+    parser.add_argument("--skip-startup", action="store_true")
+    parser.add_argument("--skip-reprocess", action="store_true")
+    parser.add_argument("--reprocess-articles", type=int, default=2000, help="Cached pages for the reprocess benchmark.")
+    parser.add_argument("--output", default=None, help="Result file (default: results/<timestamp>.json).")
+    parser.add_argument("--baseline", default=None, help="Previous result file to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%).")
+    args = parser.parse_args()
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    # Must be set before models.py is imported anywhere
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.db)}"
+    # Scratch page cache next to the scratch database (the reprocess benchmark fills it)
+    os.environ["PAGE_CACHE_DIR"] = os.path.join(RESULTS_DIR, "page_cache")
+
+    from benchmarks.stubs import install_stubs
+    from benchmarks.datagen import generate
+
+    install_stubs(page_latency=args.page_latency, llm_latency=args.llm_latency)
+
+    report = {
+        "started_at": datetime.datetime.utcnow().isoformat() + "Z",
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": vars(args),
+        "results": {},
+    }
+
+    if not args.reuse_db:
+        shutil.rmtree(os.environ["PAGE_CACHE_DIR"], ignore_errors=True)
+        print(f"Generating {args.rows} synthetic articles into {args.db} ...")
+        report["results"]["datagen"] = generate(args.rows)
+
+    if not args.skip_startup:
+        from benchmarks.startup import run_startup
+        print("Running startup benchmark ...")
+        report["results"]["startup"] = run_startup(repeat=args.repeat)
+
+    if not args.skip_micro:
+        from benchmarks.micro import run_micro
+        print("Running micro-benchmarks ...")
+        report["results"]["micro"] = run_micro(sample=args.sample, repeat=args.repeat)
+
+    if not args.skip_micro:
+        from benchmarks.serialization import run_serialization
+        print("Running serialization/compression benchmarks ...")
+        report["results"]["serialization"] = run_serialization(repeat=args.repeat)
+
+    if not args.skip_load:
+        from benchmarks.load import run_load
+        levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+        endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+        print(f"Running load test at concurrency {levels} ...")
+        report["results"]["load"] = run_load(levels, args.duration, endpoints)
+
+    if not args.skip_reprocess:
+        from benchmarks.reprocess import run_reprocess
+        print(f"Running reprocess benchmark over {args.reprocess_articles} cached pages ...")
+        report["results"]["reprocess"] = run_reprocess(args.reprocess_articles)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ") + ".json"
+    )
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for key, before, now, ratio in regressions:
+            print(f"REGRESSION {key}: {before} -> {now} ({ratio}x)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# backend/benchmarks/serialization.py
+
+"""
+Bytes and CPU per request for the large JSON payloads (/api/insights and
+/api/dashboard-feed): stdlib json vs orjson serialization, and identity vs
+gzip vs brotli response encoding. Runs through the Flask test client so the
+numbers include the provider and the after_request compression hook.
+"""
+
+import json
+import time
+
+from benchmarks.timing import measure
+
+
+def run_serialization(repeat: int = 5) -> dict:
+    import responses
+    from app import create_app
+    from flask.json.provider import DefaultJSONProvider
+
+    app = create_app()
+    client = app.test_client()
+    results = {}
+    original_provider = app.json
+
+    try:
+        for path in ("/api/insights", "/api/dashboard-feed"):
+            payload = json.loads(client.get(path, headers={"Accept-Encoding": "identity"}).data)
+            entry = {}
+
+            # Serialization alone (same sorted-keys, compact settings as the providers)
+            entry["json_dumps"] = measure(lambda: json.dumps(payload, sort_keys=True, separators=(",", ":")), repeat=repeat)
+            if responses.orjson is not None:
+                entry["orjson_dumps"] = measure(lambda: responses.orjson.dumps(payload, option=responses.orjson.OPT_SORT_KEYS), repeat=repeat)
+
+            # Full request through Flask, per provider x encoding
+            providers = {"json": DefaultJSONProvider(app)}
+            if responses.orjson is not None:
+                providers["orjson"] = responses.OrjsonProvider(app)
+            encodings = ["identity", "gzip"] + (["br"] if responses.brotli is not None else [])
+
+            for provider_name, provider in providers.items():
+                app.json = provider
+                for encoding in encodings:
+                    headers = {"Accept-Encoding": encoding}
+                    timing = measure(lambda: client.get(path, headers=headers), repeat=repeat)
+                    started = time.process_time()
+                    response = client.get(path, headers=headers)
+                    timing["cpu_ms"] = round((time.process_time() - started) * 1000, 3)
+                    timing["bytes"] = len(response.data)
+                    timing["content_encoding"] = response.headers.get("Content-Encoding", "identity")
+                    entry[f"request_{provider_name}_{encoding}"] = timing
+
+            baseline = entry["request_json_identity"]
+            best_name = min((k for k in entry if k.startswith("request_")), key=lambda k: entry[k]["bytes"])
+            entry["bytes_saved_vs_baseline"] = baseline["bytes"] - entry[best_name]["bytes"]
+            results[path] = entry
+    finally:
+        app.json = original_provider
+    return results
@@ -0,0 +1,122 @@
+# backend/benchmarks/startup.py
+
+"""
+Worker boot cost: what `import app` and a full gunicorn worker boot (create_app() plus the
+post_worker_init hook, as a worker that loses the leader election) pull in, via
+`python -X importtime`, and how long create_app() takes. Run from backend/:
+
+    python -m benchmarks.startup            # report
+    python -m benchmarks.startup --check    # exit non-zero if a heavy stack loads at boot
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.timing import summarize_ms
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Scraping/LLM/migration stacks that read-only workers must not import at boot
+HEAVY_MODULES = ("ollama", "feedparser", "bs4", "lxml", "newspaper", "numpy", "alembic", "flask_mail")
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """{module: (self_us, cumulative_us)} from `-X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if len(parts) != 3 or not parts[0].isdigit():
+            continue
+        modules[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return modules
+
+
+# What gunicorn runs in each worker: the app factory, then the post_worker_init hook
+WORKER_BOOT_STATEMENT = (
+    "import runpy; from types import SimpleNamespace; "
+    "hooks = runpy.run_path('gunicorn.conf.py'); "
+    "import app; hooks['post_worker_init'](SimpleNamespace(wsgi=app.create_app()))"
+)
+
+
+def measure_import(statement: str = "import app", env: dict = None) -> dict:
+    """Runs `statement` in a fresh interpreter and reports total import time, top modules and heavy imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=BACKEND_DIR, capture_output=True, text=True, env=env or os.environ.copy(),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"`{statement}` failed: {result.stderr.strip().splitlines()[-1:]}")
+
+    modules = _parse_importtime(result.stderr)
+    top_level = {name: cum for name, (_, cum) in modules.items() if "." not in name}
+    loaded_heavy = sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+    return {
+        "total_ms": round(sum(self_us for self_us, _ in modules.values()) / 1000, 1),
+        "modules_loaded": len(modules),
+        "top_modules_ms": {
+            name: round(cum / 1000, 1)
+            for name, cum in sorted(top_level.items(), key=lambda kv: -kv[1])[:10]
+        },
+        "heavy_modules_loaded": loaded_heavy,
+    }
+
+
+def measure_worker_boot() -> dict:
+    """
+    measure_import() of a worker boot while this process holds the leader lock, so the worker
+    stays on standby like all but one gunicorn worker (the leader's imports are expected).
+    """
+    import fcntl
+
+    with tempfile.NamedTemporaryFile(prefix="compintel-leader-", suffix=".lock") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        env = {**os.environ, "SCHEDULER_LOCK_FILE": lock.name}
+        return measure_import(WORKER_BOOT_STATEMENT, env)
+
+
+def measure_create_app(repeat: int = 5) -> dict:
+    """create_app() wall time in a fresh interpreter per run (cold, like a newly forked worker)."""
+    code = (
+        "import time; t = time.perf_counter(); import app; app.create_app(); "
+        "print(time.perf_counter() - t)"
+    )
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR,
+                             capture_output=True, text=True, check=True, env=os.environ.copy())
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return summarize_ms(samples)
+
+
+def run_startup(repeat: int = 5) -> dict:
+    return {"import": measure_import(), "worker_boot": measure_worker_boot(), "create_app": measure_create_app(repeat)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker boot-time benchmark.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true",
+                        help="Fail if any heavy module is imported by `import app` or a standby worker boot.")
+    args = parser.parse_args()
+
+    result = run_startup(args.repeat)
+    print(json.dumps(result, indent=2))
+    failed = False
+    for key, label in (("import", "`import app`"), ("worker_boot", "a standby worker boot")):
+        heavy = result[key]["heavy_modules_loaded"]
+        if args.check and heavy:
+            print(f"REGRESSION: {label} loads {', '.join(heavy)}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
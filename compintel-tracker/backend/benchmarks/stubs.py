@@ -0,0 +1,144 @@
+# backend/benchmarks/stubs.py
+
+"""
+Offline stand-ins for the network (RSS + article pages) and the Ollama server.
+
+install_stubs() swaps the `requests`, `feedparser` and `ollama` names inside
+source_health.py, fetcher.py and summarizer.py, so the real scraping and
+summarization code paths run unchanged against deterministic synthetic inputs
+while the rest of the process (e.g. the HTTP load generator) keeps the real
+`requests` module.
+"""
+
+import itertools
+import json
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+import requests
+
+# Article page template with the kind of noise extract_text_from_url() strips out
+PAGE_TEMPLATE = """<html><head><title>{title}</title>
+<script>var tracking = {{"id": 42}};</script><style>body {{ font-family: sans-serif; }}</style>
+</head><body>
+<nav><a href="/">Home</a><a href="/ai">AI</a><a href="/security">Security</a></nav>
+<div class="sidebar"><p>Subscribe to our newsletter for the latest updates.</p></div>
+<article><h1>{title}</h1>{paragraphs}</article>
+<aside><p>Related: more stories you might like.</p></aside>
+<footer><p>Copyright 2025. All rights reserved.</p></footer>
+</body></html>"""
+
+SENTENCES = [
+    "The company announced a new feature aimed at enterprise customers running large AI workloads.",
+    "Analysts expect the pricing change to put pressure on smaller SaaS competitors this quarter.",
+    "Security researchers disclosed a critical vulnerability affecting several hosted deployments.",
+    "The launch follows months of private beta testing with a handful of design partners.",
+    "Executives said the acquisition would transform how the platform handles data pipelines.",
+    "Customers reported a major outage that lasted several hours across two regions.",
+    "The update makes it easier for developers to integrate the API into existing tools.",
+    "A lawsuit filed last week alleges the startup misused proprietary training data.",
+    "Revenue grew faster than expected, driven by strong adoption among mid-market teams.",
+    "The roadmap includes deeper integrations with popular observability and CI products.",
+]
+
+TAGS = ["AI", "Security", "Pricing", "Launch", "Funding", "Threat", "Trend", "Partnership",
+        "Recommendation", "Infrastructure", "Regulation", "Product"]
+
+
+def build_article_html(title: str, rng: random.Random, paragraphs: int = 25) -> str:
+    body = "".join(
+        "<p>" + " ".join(rng.choice(SENTENCES) for _ in range(4)) + "</p>"
+        for _ in range(paragraphs)
+    )
+    return PAGE_TEMPLATE.format(title=title, paragraphs=body)
+
+
+def build_summary(rng: random.Random) -> dict:
+    """Returns a summary dict with the same schema summarize_text() produces."""
+    return {
+        "bullets": rng.sample(SENTENCES, 3),
+        "insight": rng.choice(SENTENCES),
+        "tags": rng.sample(TAGS, 3),
+    }
+
+
+class _FakeResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+        self.apparent_encoding = "utf-8"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} for {self.url}")
+
+
+class _FakeFeed:
+    def __init__(self, entries):
+        self.entries = entries
+        self.bozo = 0
+
+
+class _FakeOllamaClient:
+    latency = 0.0
+    latency_per_kchar = 0.0   # Models prompt processing cost, which grows with prompt length
+
+    def __init__(self, host=None, **kwargs):
+        self.host = host
+
+    def generate(self, model=None, prompt="", format=None, options=None, **kwargs):
+        delay = self.latency + self.latency_per_kchar * len(prompt) / 1000.0
+        if delay:
+            time.sleep(delay)
+        rng = random.Random(len(prompt))
+        return {"response": json.dumps(build_summary(rng))}
+
+
+def install_stubs(page_latency: float = 0.0, llm_latency: float = 0.0, llm_latency_per_kchar: float = 0.0, seed: int = 7):
+    """
+    Replaces requests.get (as seen by source_health), feedparser.parse and ollama.Client.
+    Every parsed feed yields fresh, unique article URLs so ingest always has new work.
+    Also turns the page cache off, so fetch timings don't include its zlib write and DB commit.
+    """
+    import fetcher
+    import summarizer
+    import page_cache
+    import source_health
+
+    rng = random.Random(seed)
+    rng_lock = threading.Lock()
+    counter = itertools.count()
+
+    def fake_get(url, headers=None, timeout=None, **kwargs):
+        if page_latency:
+            time.sleep(page_latency)
+        with rng_lock:
+            html = build_article_html(f"Synthetic article {url}", rng)
+        return _FakeResponse(url, html)
+
+    def fake_parse(source, *args, **kwargs):
+        entries = []
+        for _ in range(10):
+            n = next(counter)
+            entries.append({
+                "title": f"Synthetic entry {n}",
+                "link": f"https://bench.invalid/articles/{n}",
+            })
+        return _FakeFeed(entries)
+
+    _FakeOllamaClient.latency = llm_latency
+    _FakeOllamaClient.latency_per_kchar = llm_latency_per_kchar
+
+    source_health.requests = SimpleNamespace(get=fake_get, exceptions=requests.exceptions)
+    # Every stubbed article lives on one host; don't let politeness limits skew timings
+    source_health.HOST_RATE_PER_SECOND = 1e9
+    source_health.HOST_RATE_BURST = 1e9
+    fetcher.feedparser = SimpleNamespace(parse=fake_parse)
+    summarizer.ollama = SimpleNamespace(Client=_FakeOllamaClient)
+    page_cache.PAGE_CACHE_MAX_BYTES = 0   # benchmarks.reprocess fills the cache itself
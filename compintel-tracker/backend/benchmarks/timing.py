@@ -0,0 +1,44 @@
+# backend/benchmarks/timing.py
+
+import statistics
+import time
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list (0 < pct <= 100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[k]
+
+
+def summarize_ms(samples_s) -> dict:
+    """Converts a list of durations in seconds into a millisecond summary."""
+    ms = [s * 1000.0 for s in samples_s]
+    return {
+        "min_ms": round(min(ms), 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p95_ms": round(percentile(ms, 95), 4),
+        "max_ms": round(max(ms), 4),
+        "samples": len(ms),
+    }
+
+
+def measure(fn, repeat: int = 5, number: int = 1, warmup: int = 1) -> dict:
+    """
+    Times `fn()` `repeat` times (each run calling it `number` times) after `warmup` calls.
+    Reported figures are per call.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+    result = summarize_ms(samples)
+    result["calls_per_second"] = round(1000.0 / result["median_ms"], 2) if result["median_ms"] else None
+    return result
@@ -0,0 +1,150 @@
+import json
+import logging
+
+# ----------------------------------------------------------------------
+# --- ARTICLE CLASSIFICATION (Shared by Feed, Insights and Digest) ---
+# ----------------------------------------------------------------------
+
+# --- Define severity keywords for KPI calculation ---
+CRITICAL_KPI_KEYWORDS = [
+    '%critical%',
+    '%vulnerability%',
+    '%threat%',
+    '%lawsuit%',
+    '%top 10%',
+    '%transform%'
+]
+# Define high-priority keywords for digest generation
+HIGH_PRIORITY_KEYWORDS = ['critical', 'vulnerability', 'threat', 'major security',
+                          'major outage', 'lawsuit', 'acquisition', 'top 10', 'transform']
+
+# Dashboard feed severity keywords
+CRITICAL_KEYWORDS = ['critical', 'vulnerability', 'threat', 'major security', 'major outage', 'lawsuit', 'acquisition', 'top 10', 'transform']
+MEDIUM_KEYWORDS = ['launch', 'new feature', 'pricing change', 'high priority', 'review', 'guide', 'easier']
+
+# Statuses that keep an article on the Insights page (anything else counts as resolved)
+INSIGHT_STATUSES = ['pending', 'actioned_note_added']
+
+# 🌟 CATEGORY FIX: Define generic tags to ignore 🌟
+GENERIC_TAGS = ['general', 'product', 'pricing', 'update', 'launch', 'feature', 'review', 'analysis', 'tech', 'saas', 'ai']
+
+
+def classify_feed_article(a, warn: bool = True) -> dict:
+    """Builds the dashboard feed entry (summary, tags, severity) for an article."""
+    severity = "Normal"
+    main_summary = a.summary
+    tags = ["General"]
+
+    full_text = a.title.lower()
+
+    try:
+        summary_data = json.loads(a.summary)
+        main_summary = summary_data.get("insight") or summary_data.get("bullets", [""])[0]
+        tags = summary_data.get("tags", ["General"])
+
+        full_text += " " + main_summary.lower()
+        normalized_tags = [t.lower().strip() for t in tags]
+        full_text += " " + " ".join(normalized_tags)
+
+    except Exception as e:
+        if warn:
+            logging.warning(f"Summary for article ID {a.id} is not valid JSON. Using raw summary. Error: {e}")
+        full_text += " " + a.summary.lower()
+        tags = ["Parsing Error"]
+
+    # SEVERITY DETERMINATION
+    if any(k in full_text for k in CRITICAL_KEYWORDS):
+        severity = "Critical"
+    elif any(k in full_text for k in MEDIUM_KEYWORDS):
+        severity = "Medium"
+
+    if "Parsing Error" in tags:
+        severity = "Error"
+
+    return {
+        "id": a.id,
+        "competitor": a.competitor,
+        "time_ago": a.fetched_at.strftime('%Y-%m-%d %H:%M'),
+        "title": a.title,
+        "summary": main_summary,
+        "tags": tags,
+        "source_url": a.url,
+        "status": a.status,
+        "severity": severity
+    }
+
+
+def classify_insight_article(a) -> dict:
+    """Builds the insights page entry (summary, category, priority) for an article."""
+    priority = "Medium Priority"
+    category = "General"
+
+    full_text = a.title.lower()
+    main_summary = "No actionable insight provided."
+    insight_tags = []
+
+    try:
+        summary = json.loads(a.summary)
+        main_summary = summary.get("insight") or summary.get("bullets", [""])[0]
+        insight_tags = summary.get("tags", [])
+
+        full_text += " " + main_summary.lower()
+        normalized_tags = [t.lower().strip() for t in insight_tags]
+        full_text += " " + " ".join(normalized_tags)
+
+        # Find the first tag that is NOT generic to use as the main Category
+        specific_category = next(
+            (t for t in normalized_tags if t not in GENERIC_TAGS and t),
+            "General"
+        )
+        category = specific_category.title()
+
+    except Exception:
+        full_text += " " + a.summary.lower()
+        insight_tags = ["Parsing Error"]
+        category = "Parsing Error"
+
+    # Determine Priority
+    if any(k in full_text for k in HIGH_PRIORITY_KEYWORDS):
+        priority = "High Priority"
+
+    return {
+        "id": a.id,
+        "competitor": a.competitor,
+        "title": a.title,
+        "summary": main_summary,
+        "category": category,
+        "priority": priority,
+        "status": a.status,
+        "action_notes": None,
+        "tags": insight_tags
+    }
+
+
+def collect_digest_insights(articles) -> list:
+    """Filters articles down to the high-priority entries used in the digest email."""
+    high_priority_insights = []
+
+    for a in articles:
+        full_text = a.title.lower() + (a.summary.lower() if a.summary else "")
+
+        if any(k in full_text for k in HIGH_PRIORITY_KEYWORDS):
+            main_summary = "Action required."
+            category = "General"
+            try:
+                summary_data = json.loads(a.summary)
+                main_summary = summary_data.get("insight") or summary_data.get("bullets", [""])[0]
+                category = summary_data.get("tags", ["General"])[0]
+            except:
+                pass
+
+            high_priority_insights.append({
+                'competitor': a.competitor,
+                'title': a.title,
+                'summary': main_summary,
+                'source_url': a.url,
+                'priority': 'High Priority',
+                'category': category
+            })
+
+    return high_priority_insights
@@ -0,0 +1,194 @@
+import csv
+import io
+import json
+import os
+import datetime
+from sqlalchemy import select
+
+from models import SessionLocal, Article
+from classifier import INSIGHT_STATUSES, classify_insight_article
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ----------------------------------------------------------------------
+# --- STREAMING BULK EXPORT (NDJSON / CSV) ---
+# ----------------------------------------------------------------------
+
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1000))   # Rows fetched per round trip
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_KINDS = ('articles', 'insights')
+
+ARTICLE_FIELDS = ['id', 'competitor', 'title', 'url', 'status', 'published', 'fetched_at', 'summary']
+INSIGHT_FIELDS = ['id', 'competitor', 'title', 'url', 'fetched_at', 'summary', 'category',
+                  'priority', 'status', 'tags']
+
+
+class ExportParamError(ValueError):
+    """Invalid export query parameter (reported to the client as a 400)."""
+
+
+def parse_utc_datetime(value: str) -> datetime.datetime:
+    """ISO date/datetime as naive UTC (how every DateTime column is stored); offsets and Z are converted."""
+    parsed = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_datetime(value: str, name: str):
+    try:
+        return parse_utc_datetime(value)
+    except ValueError:
+        raise ExportParamError(f"{name} must be an ISO date or datetime (YYYY-MM-DD[THH:MM:SS][Z|+HH:MM], UTC if no offset).")
+
+
+def _parse_int(value: str, name: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise ExportParamError(f"{name} must be an integer.")
+    if number < 0:
+        raise ExportParamError(f"{name} must not be negative.")
+    return number
+
+
+def _split(value: str) -> list:
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+
+def parse_export_params(kind: str, args) -> dict:
+    """
+    Validates the export query string up front (before any bytes are streamed).
+    Params: format (ndjson|csv), competitor / status (comma-separated), since / until
+    (on fetched_at in UTC, until is exclusive), after_id (resume cursor), limit, include_content.
+    """
+    if kind not in EXPORT_KINDS:
+        raise ExportParamError(f"Unknown export '{kind}'; expected one of {list(EXPORT_KINDS)}.")
+
+    fmt = args.get('format', 'ndjson').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ExportParamError(f"format must be one of {list(EXPORT_FORMATS)}.")
+
+    statuses = _split(args.get('status', ''))
+    if not statuses and kind == 'insights':
+        statuses = INSIGHT_STATUSES
+
+    return {
+        "kind": kind,
+        "format": fmt,
+        "competitors": _split(args.get('competitor', '')),
+        "statuses": statuses,
+        "since": _parse_datetime(args['since'], 'since') if args.get('since') else None,
+        "until": _parse_datetime(args['until'], 'until') if args.get('until') else None,
+        "after_id": _parse_int(args['after_id'], 'after_id') if args.get('after_id') else 0,
+        "limit": _parse_int(args['limit'], 'limit') if args.get('limit') else None,
+        "include_content": kind == 'articles' and args.get('include_content') in ('1', 'true'),
+    }
+
+
+def _build_query(params: dict, after_id: int, limit: int):
+    """One batch: the next `limit` matching rows with id > after_id."""
+    columns = [Article.id, Article.competitor, Article.title, Article.url, Article.status,
+               Article.published, Article.fetched_at, Article.summary]
+    if params["include_content"]:
+        columns.append(Article.content)
+
+    # Keyset pagination on the primary key: every batch (and an after_id resume) is an index seek, not an OFFSET scan
+    query = select(*columns).where(Article.id > after_id)
+    if params["competitors"]:
+        query = query.where(Article.competitor.in_(params["competitors"]))
+    if params["statuses"]:
+        query = query.where(Article.status.in_(params["statuses"]))
+    if params["since"]:
+        query = query.where(Article.fetched_at >= params["since"])
+    if params["until"]:
+        query = query.where(Article.fetched_at < params["until"])
+    return query.order_by(Article.id).limit(limit)
+
+
+def _batches(db, params: dict):
+    """
+    Yields lists of rows, EXPORT_BATCH_SIZE at a time. Each batch is its own short read
+    transaction, ended before the batch is handed out: a cursor left open while a slow
+    client downloads would hold SQLite's read lock and block every writer meanwhile.
+    """
+    after_id = params["after_id"]
+    remaining = params["limit"]
+    while remaining is None or remaining > 0:
+        size = EXPORT_BATCH_SIZE if remaining is None else min(EXPORT_BATCH_SIZE, remaining)
+        rows = db.execute(_build_query(params, after_id, size)).all()
+        db.rollback()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < size:
+            return
+        after_id = rows[-1].id
+        if remaining is not None:
+            remaining -= len(rows)
+
+
+def _to_record(row, params: dict) -> dict:
+    if params["kind"] == 'insights':
+        insight = classify_insight_article(row)
+        record = {field: insight.get(field) for field in INSIGHT_FIELDS}
+        record["url"] = row.url
+        record["fetched_at"] = row.fetched_at
+        return record
+    record = {field: getattr(row, field) for field in ARTICLE_FIELDS}
+    if params["include_content"]:
+        record["content"] = row.content
+    return record
+
+
+def _ndjson_line(record: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=str, ensure_ascii=False) + "\n").encode()
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "; ".join(str(v) for v in value)
+    return value
+
+
+def export_fields(params: dict) -> list:
+    fields = INSIGHT_FIELDS if params["kind"] == 'insights' else list(ARTICLE_FIELDS)
+    if params["include_content"]:
+        fields = fields + ['content']
+    return fields
+
+
+def stream_export(params: dict):
+    """
+    Generator of encoded chunks (one per batch of rows). Opens its own session so it can
+    outlive the request handler; rows come out in id order, so a client that lost the
+    connection resumes with after_id=<last id received>.
+    """
+    db = SessionLocal()
+    try:
+        if params["format"] == 'csv':
+            fields = export_fields(params)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            for batch in _batches(db, params):
+                for row in batch:
+                    record = _to_record(row, params)
+                    writer.writerow([_csv_value(record.get(f)) for f in fields])
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode()
+        else:
+            for batch in _batches(db, params):
+                yield b"".join(_ndjson_line(_to_record(row, params)) for row in batch)
+    finally:
+        db.close()
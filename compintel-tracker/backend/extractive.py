@@ -0,0 +1,131 @@
+import re
+import numpy as np
+
+# ----------------------------------------------------------------------
+# --- EXTRACTIVE SENTENCE RANKING (TF-IDF + TextRank, NumPy only) ---
+# ----------------------------------------------------------------------
+
+MAX_INPUT_CHARS = 60000     # Hard cap on what gets ranked (very long pages are mostly boilerplate)
+MAX_SENTENCES = 400         # Keeps the similarity matrix small (400 x 400)
+CHARS_PER_TOKEN = 4         # Rough token estimate used for prompt budgets
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 30
+LEAD_BONUS = 0.15           # News copy front-loads the key facts: boost the opening sentences
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"“(])|\n+')
+_WORD = re.compile(r"[a-z][a-z0-9'-]+")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her here
+hers herself him himself his how i if in into is it its itself just me more most my myself no nor not now of off
+on once only or other our ours ourselves out over own same she should so some such than that the their theirs
+them themselves then there these they this those through to too under until up very was we were what when where
+which while who whom why will with would you your yours yourself yourselves said says new one two also
+several many last week weeks month months year years today according like get got make made
+""".split())
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def split_sentences(text: str) -> list:
+    """Splits article text into trimmed sentences, dropping fragments too short to carry content."""
+    sentences = (s.strip() for s in _SENTENCE_SPLIT.split(text[:MAX_INPUT_CHARS]))
+    # dict.fromkeys drops repeats (pull quotes, captions) while keeping order
+    return list(dict.fromkeys(s for s in sentences if len(s) > 25))[:MAX_SENTENCES]
+
+
+def tokenize(sentence: str) -> list:
+    return [w for w in _WORD.findall(sentence.lower()) if w not in STOPWORDS]
+
+
+def tfidf_matrix(token_lists: list):
+    """Returns (L2-normalized TF-IDF matrix [sentences x vocab], vocab list, idf vector)."""
+    vocab = {}
+    rows, cols = [], []
+    for i, tokens in enumerate(token_lists):
+        for w in tokens:
+            rows.append(i)
+            cols.append(vocab.setdefault(w, len(vocab)))
+
+    n = len(token_lists)
+    tf = np.zeros((n, max(len(vocab), 1)), dtype=np.float32)
+    if rows:
+        np.add.at(tf, (np.array(rows), np.array(cols)), 1.0)
+
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((1.0 + n) / (1.0 + df)).astype(np.float32) + 1.0
+    x = np.log1p(tf) * idf
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    x /= np.where(norms == 0, 1.0, norms)
+    return x, list(vocab), idf
+
+
+def rank_sentences(sentences: list) -> np.ndarray:
+    """TextRank over the TF-IDF cosine-similarity graph, with a small lead bias. Returns one score per sentence."""
+    n = len(sentences)
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    if n == 1:
+        return np.ones(1, dtype=np.float32)
+
+    x, _, _ = tfidf_matrix([tokenize(s) for s in sentences])
+    sim = x @ x.T
+    np.fill_diagonal(sim, 0.0)
+
+    out_weight = sim.sum(axis=1, keepdims=True)
+    transition = np.divide(sim, out_weight, out=np.full_like(sim, 1.0 / n), where=out_weight > 0)
+
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    teleport = (1.0 - TEXTRANK_DAMPING) / n
+    for _ in range(TEXTRANK_ITERATIONS):
+        updated = teleport + TEXTRANK_DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-6:
+            scores = updated
+            break
+        scores = updated
+
+    position = 1.0 + LEAD_BONUS * np.exp(-np.arange(n, dtype=np.float32) / 3.0)
+    return scores * position
+
+
+def select_sentences(sentences: list, scores: np.ndarray, token_budget: int) -> list:
+    """Greedily keeps the best-scoring sentences that fit the budget, returned in original order."""
+    chosen, used = [], 0
+    for i in np.argsort(-scores, kind="stable"):
+        cost = estimate_tokens(sentences[i])
+        if used + cost > token_budget:
+            continue
+        chosen.append(i)
+        used += cost
+    return [sentences[i] for i in sorted(chosen)]
+
+
+def compress_text(text: str, token_budget: int) -> str:
+    """
+    Shrinks article text to its most informative sentences within `token_budget` tokens.
+    Text that already fits is returned unchanged.
+    """
+    if not text or estimate_tokens(text) <= token_budget:
+        return text
+    sentences = split_sentences(text)
+    if not sentences:
+        return text[:token_budget * CHARS_PER_TOKEN]
+    scores = rank_sentences(sentences)
+    selected = select_sentences(sentences, scores, token_budget)
+    if not selected:
+        # Even the best sentence is over budget: fall back to a hard cut of it
+        return sentences[int(np.argmax(scores))][:token_budget * CHARS_PER_TOKEN]
+    return "\n".join(selected)
+
+
+def top_keywords(sentences: list, k: int = 3) -> list:
+    """Returns the `k` terms with the highest summed TF-IDF weight across the sentences."""
+    token_lists = [tokenize(s) for s in sentences]
+    if not any(token_lists):
+        return []
+    x, vocab, _ = tfidf_matrix(token_lists)
+    weights = x.sum(axis=0)
+    return [vocab[i] for i in np.argsort(-weights, kind="stable")[:k]]
@@ -4,7 +4,9 @@ import requests
 from bs4 import BeautifulSoup
 import re 
 # 🌟 Import the function by the final, simple name 🌟
-from summarizer import summarize_text # Corrected to summarize_text
+from summarizer import summarize_tiered
+from source_health import guarded_get, SourceUnavailable
+from page_cache import store_page, decode_body
 
 # ----------------------------------------------------------------------
 # --- COMPETITOR DATA MANAGEMENT (Updated) ---
@@ -53,72 +55,92 @@ def add_competitor(name: str, rss_link: str, webpage_link: str, description: str
 # --- SCRAPING AND SUMMARIZATION LOGIC (Unchanged/Refined) ---
 # ----------------------------------------------------------------------
 
-# --- Extract clean text from a URL (FIXED FOR AI TRENDS) ---
+# --- Extract clean text from downloaded HTML (FIXED FOR AI TRENDS) ---
+def extract_text_from_html(html: str) -> str:
+    """Main-content text of an article page. Shared by live fetching and reprocess.py (cached pages)."""
+    # Use 'lxml' parser which is generally faster and more fault-tolerant
+    soup = BeautifulSoup(html, "lxml") 
+
+    # Remove irrelevant tags (scripts, styles, navigation, footer, ads)
+    for selector in ["script", "style", "nav", "footer", "aside", ".sidebar", ".ad", ".banner-unit"]:
+        for tag in soup.find_all(selector):
+            tag.decompose()
+
+    # 🌟 IMPROVED TARGETING: Added 'td-post-content' (common for AI TRENDS) 🌟
+    main_content_tags = soup.find_all([
+        'article', 
+        'main', 
+        {'id': re.compile(r'content|main|article', re.I)}, 
+        # Added td-post-content for better coverage of AI Trends
+        {'class': re.compile(r'content|article|post|body|story|td-post-content', re.I)} 
+    ])
+
+    if main_content_tags:
+        # Use the first successful finding
+        main_element = main_content_tags[0]
+        
+        # Extract only the text from paragraphs within the main element
+        article_paragraphs = [p.get_text(strip=True) for p in main_element.find_all('p')]
+        article_text = "\n\n".join(article_paragraphs)
+        
+        # Fallback logic
+        if len(article_text) < 100: 
+            text = main_element.get_text(separator="\n")
+        else:
+            text = article_text
+    else:
+        # If no main content tag found, fall back to simple full-page extraction
+        text = soup.get_text(separator="\n")
+
+
+    # Clean up text: collapse multiple newlines, remove lines that are mostly whitespace/punctuation
+    lines = [line.strip() for line in text.splitlines()]
+    
+    # Filter out very short or non-substantive lines (e.g., "Skip to content")
+    lines = [line for line in lines if len(line) > 20 or re.search(r'[a-zA-Z]{3,}', line)]
+    
+    # Join the remaining clean text
+    return "\n".join(lines)
+
+# --- Extract clean text from a URL ---
 def extract_text_from_url(url: str) -> str:
     try:
-        # Use a common user-agent
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"}
-        r = requests.get(url, headers=headers, timeout=15)
+        # Circuit breaker + per-host rate limit; uses a common user-agent and (connect, read) timeouts
+        r = guarded_get(url)
         r.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-        
-        # Use 'lxml' parser which is generally faster and more fault-tolerant
-        soup = BeautifulSoup(r.text, "lxml") 
-
-        # Remove irrelevant tags (scripts, styles, navigation, footer, ads)
-        for selector in ["script", "style", "nav", "footer", "aside", ".sidebar", ".ad", ".banner-unit"]:
-            for tag in soup.find_all(selector):
-                tag.decompose()
-
-        # 🌟 IMPROVED TARGETING: Added 'td-post-content' (common for AI TRENDS) 🌟
-        main_content_tags = soup.find_all([
-            'article', 
-            'main', 
-            {'id': re.compile(r'content|main|article', re.I)}, 
-            # Added td-post-content for better coverage of AI Trends
-            {'class': re.compile(r'content|article|post|body|story|td-post-content', re.I)} 
-        ])
-
-        if main_content_tags:
-            # Use the first successful finding
-            main_element = main_content_tags[0]
-            
-            # Extract only the text from paragraphs within the main element
-            article_paragraphs = [p.get_text(strip=True) for p in main_element.find_all('p')]
-            article_text = "\n\n".join(article_paragraphs)
-            
-            # Fallback logic
-            if len(article_text) < 100: 
-                text = main_element.get_text(separator="\n")
-            else:
-                text = article_text
-        else:
-            # If no main content tag found, fall back to simple full-page extraction
-            text = soup.get_text(separator="\n")
 
+        # Keep the raw page so extraction/summarization can be re-run later without re-downloading
+        encoding = r.encoding or r.apparent_encoding
+        store_page(url, r.content, r.headers.get("Content-Type"), encoding)
 
-        # Clean up text: collapse multiple newlines, remove lines that are mostly whitespace/punctuation
-        lines = [line.strip() for line in text.splitlines()]
-        
-        # Filter out very short or non-substantive lines (e.g., "Skip to content")
-        lines = [line for line in lines if len(line) > 20 or re.search(r'[a-zA-Z]{3,}', line)]
-        
-        # Join the remaining clean text
-        clean_text = "\n".join(lines)
-        
-        return clean_text
+        return extract_text_from_html(decode_body(r.content, encoding))
         
+    except SourceUnavailable:
+        # Host is tripped or throttled: let the caller skip the entry so it is retried later
+        raise
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        # Same transient host failures that trip the breaker: skip now, retry on the next poll
+        raise SourceUnavailable(f"{url}: {type(e).__name__}") from e
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if status is not None and (status >= 500 or status == 429):
+            raise SourceUnavailable(f"{url}: HTTP {status}") from e
+        return ""   # 404 and other permanent client errors
     except requests.exceptions.RequestException:
-        # Request failed (timeout, 404, connection error)
+        # Any other request failure (invalid URL, too many redirects)
         return ""
     except Exception as e:
         # General scraping/parsing error
         print(f"Error extracting text from {url}: {e}")
         return ""
 
-# --- Fetch RSS feed items (unchanged) ---
+# --- Fetch RSS feed items ---
 def fetch_rss_items(rss_url: str, limit: int = 5):
     try:
-        feed = feedparser.parse(rss_url)
+        # Download through the breaker (feedparser itself has no timeout), then parse the bytes
+        r = guarded_get(rss_url)
+        r.raise_for_status()
+        feed = feedparser.parse(r.content)
         return [{"title": e.get("title"), "url": e.get("link")} for e in feed.entries[:limit]]
     except Exception:
         return []
@@ -128,9 +150,8 @@ def fetch_article_content(entry: dict) -> dict:
     # 1. Scrape the full article text
     text = extract_text_from_url(entry["url"])
     
-    # 2. 🌟 Generate Summary using the imported function 🌟
-    # Call the correctly imported function: summarize_text
-    summary_data = summarize_text(text) 
+    # 2. 🌟 Generate Summary: LLM, or the local extractive tier when Ollama is slow/down 🌟
+    summary_data, summary_tier = summarize_tiered(text)
     
     # 3. Combine entry data, full content, and summary data
     return {
@@ -140,16 +161,26 @@ def fetch_article_content(entry: dict) -> dict:
         "summary": summary_data.get('insight', summary_data.get('bullets', ['Error'])[0]),
         "bullets": summary_data.get('bullets', []),
         "insight": summary_data.get('insight', 'N/A'),
-        "tags": summary_data.get('tags', [])
+        "tags": summary_data.get('tags', []),
+        "summary_tier": summary_tier
     }
 
-# --- Fetch and extract all articles for a competitor (unchanged) ---
-def fetch_and_extract(competitor: dict, rss_limit: int = 5, workers: int = 3):
+# --- Fetch and extract all articles for a competitor ---
+def fetch_and_extract(competitor: dict, rss_limit: int = 5, workers: int = 3, exclude=None):
+    """
+    `exclude` is an optional callable taking the feed's entry URLs and returning the
+    ones already stored; those entries are skipped before any scraping/summarizing.
+    Entries whose host is unavailable (breaker open, timeout, 5xx/429) are left out
+    rather than stored empty, so the next poll retries them.
+    """
     rss = competitor.get("rss")
     if not rss:
         return []
 
     items = fetch_rss_items(rss, limit=rss_limit)
+    if exclude is not None:
+        already_known = exclude([item["url"] for item in items if item.get("url")])
+        items = [item for item in items if item.get("url") and item["url"] not in already_known]
     results = []
 
     # Use ThreadPoolExecutor to fetch article content concurrently
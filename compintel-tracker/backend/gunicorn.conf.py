@@ -0,0 +1,14 @@
+# backend/gunicorn.conf.py
+# Used by render.yaml: `gunicorn -c gunicorn.conf.py 'app:create_app()'`
+
+
+def on_starting(server):
+    """Runs once in the master before any worker forks: migrate the schema a single time."""
+    from models import init_db
+    init_db()
+
+
+def post_worker_init(worker):
+    """Every worker joins the leader election; only the winner runs the digest + feed poller."""
+    from app import start_background_tasks
+    start_background_tasks(worker.wsgi)
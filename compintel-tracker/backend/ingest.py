@@ -0,0 +1,161 @@
+import json
+import time
+import datetime
+import logging
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from models import SessionLocal, Article, SummaryUpgrade
+from fetcher import fetch_and_extract
+from source_health import registry as source_health
+from summarizer import summarize_if_idle, LLM_FAILURE_INSIGHTS
+from trends import record_article, article_dimensions, move_article
+
+UPGRADE_BATCH_SIZE = 5           # Articles upgraded per round
+UPGRADE_INTERVAL_SECONDS = 60    # Pause between rounds
+UPGRADE_MAX_ATTEMPTS = 5         # Keep the local summary after this many invalid LLM outputs
+
+# ----------------------------------------------------------------------
+# --- INGEST (Shared by the Fetch endpoint and the Polling Scheduler) ---
+# ----------------------------------------------------------------------
+
+def ingest_competitor(db, comp: dict, rss_limit: int = 5, workers: int = 3) -> dict:
+    """
+    Fetches the competitor's feed, scrapes + summarizes only entries whose URL is
+    not stored yet, and saves them as pending articles.
+    Returns {"processed": <entries scraped>, "new_articles": <rows inserted>}.
+    """
+    def known_urls(urls):
+        if not urls:
+            return set()
+        return {u for (u,) in db.query(Article.url).filter(Article.url.in_(urls))}
+
+    try:
+        items = fetch_and_extract(comp, rss_limit=rss_limit, workers=workers, exclude=known_urls)
+    finally:
+        source_health.publish()   # Breaker changes from this fetch become visible to every worker
+    new_articles_count = 0
+
+    for item in items:
+        url = item.get('url')
+        if db.query(Article).filter(Article.url == url).first():
+            continue
+
+        summary_dict = {
+            "insight": item.get('insight', 'N/A'),
+            "bullets": item.get('bullets', []),
+            "tags": item.get('tags', [])
+        }
+
+        article = Article(
+            competitor=comp["name"],
+            url=url,
+            title=item.get('title'),
+            content=item.get('content'),
+            summary=json.dumps(summary_dict),
+            fetched_at=datetime.datetime.utcnow(),
+            status='pending'
+        )
+
+        try:
+            db.add(article)
+            record_article(db, article)
+            if item.get('summary_tier') == 'local':
+                # Summarized by the local tier: queue for an LLM upgrade when capacity frees up
+                db.flush()
+                db.add(SummaryUpgrade(article_id=article.id))
+            db.commit()
+            new_articles_count += 1
+        except IntegrityError:
+            db.rollback()
+            continue
+
+    logging.info(f"Ingest for {comp['name']}: scraped {len(items)} entries, stored {new_articles_count} new articles.")
+    return {"processed": len(items), "new_articles": new_articles_count}
+
+
+# ----------------------------------------------------------------------
+# --- LLM UPGRADE OF LOCAL-TIER SUMMARIES (Background, Leader Only) ---
+# ----------------------------------------------------------------------
+
+def enqueue_failed_summaries(db) -> int:
+    """Queues articles stored with an LLM failure placeholder (from before the local tier existed)."""
+    queued = {a for (a,) in db.query(SummaryUpgrade.article_id)}
+    failed_ids = [
+        a_id for (a_id,) in db.query(Article.id).filter(
+            or_(*[Article.summary.like(f'%"{marker}"%') for marker in LLM_FAILURE_INSIGHTS])
+        )
+        if a_id not in queued
+    ]
+    for a_id in failed_ids:
+        db.add(SummaryUpgrade(article_id=a_id))
+    db.commit()
+    return len(failed_ids)
+
+
+def upgrade_pending_summaries(db, limit: int = UPGRADE_BATCH_SIZE) -> int:
+    """
+    Re-summarizes up to `limit` queued articles with the LLM, oldest first, while it is idle.
+    Stops early as soon as the LLM is busy or down; only invalid model output counts as an
+    attempt against the article. Returns the number of upgraded articles.
+    """
+    queue = db.query(SummaryUpgrade).order_by(SummaryUpgrade.attempts, SummaryUpgrade.queued_at).limit(limit).all()
+    upgraded = 0
+
+    for entry in queue:
+        article = db.query(Article).filter(Article.id == entry.article_id).first()
+        if article is None or not article.content:
+            db.delete(entry)
+            db.commit()
+            continue
+
+        outcome, result = summarize_if_idle(article.content)
+        if outcome == "busy":
+            break
+        if outcome == "failed":
+            entry.attempts += 1
+            if entry.attempts >= UPGRADE_MAX_ATTEMPTS:
+                logging.warning(f"Giving up LLM upgrade of article {article.id} after {entry.attempts} attempts.")
+                db.delete(entry)
+            db.commit()
+            break
+
+        old_dims = article_dimensions(article)
+        article.summary = json.dumps({
+            "insight": result.get('insight', 'N/A'),
+            "bullets": result.get('bullets', []),
+            "tags": result.get('tags', [])
+        })
+        move_article(db, old_dims, article)
+        db.delete(entry)
+        db.commit()
+        upgraded += 1
+
+    return upgraded
+
+
+def run_summary_upgrader():
+    """Background loop: upgrades local-tier summaries whenever the LLM has spare capacity."""
+    db = SessionLocal()
+    try:
+        queued = enqueue_failed_summaries(db)
+        if queued:
+            logging.info(f"Queued {queued} articles with failed LLM summaries for upgrade.")
+    except Exception as e:
+        logging.error(f"Error queueing failed summaries: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+    while True:
+        db = SessionLocal()
+        try:
+            upgraded = upgrade_pending_summaries(db)
+            if upgraded:
+                logging.info(f"Upgraded {upgraded} local summaries with the LLM.")
+        except Exception as e:
+            logging.error(f"Error during summary upgrade: {e}")
+            db.rollback()
+        finally:
+            db.close()
+        time.sleep(UPGRADE_INTERVAL_SECONDS)
@@ -0,0 +1,69 @@
+import os
+import time
+import logging
+import tempfile
+import threading
+
+try:
+    import fcntl  # POSIX only; without it every process acts as leader (fine for `python app.py`)
+except ImportError:
+    fcntl = None
+
+# Standard library only: every gunicorn worker imports this at boot (post_worker_init), while the
+# scraping/LLM stacks behind the background tasks are loaded by the elected leader alone.
+
+LEADER_LOCK_FILE = os.environ.get(
+    "SCHEDULER_LOCK_FILE", os.path.join(tempfile.gettempdir(), "compintel-scheduler.lock")
+)
+LEADER_RETRY_SECONDS = 30
+
+
+# ----------------------------------------------------------------------
+# --- SINGLE-LEADER ELECTION (One scheduler across gunicorn workers) ---
+# ----------------------------------------------------------------------
+
+_leader_lock_fd = None
+_election_started = False
+_election_guard = threading.Lock()
+
+
+def try_acquire_leadership() -> bool:
+    """Takes a non-blocking exclusive lock on LEADER_LOCK_FILE; held until the process exits."""
+    global _leader_lock_fd
+    if _leader_lock_fd is not None:
+        return True
+    if fcntl is None:
+        _leader_lock_fd = -1
+        return True
+
+    fd = os.open(LEADER_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _leader_lock_fd = fd
+    return True
+
+
+def run_as_leader(on_elected):
+    """
+    Calls `on_elected()` once, in whichever process wins the leader lock. Processes that
+    lose keep retrying in a daemon thread, so a standby worker takes over if the leader dies.
+    Safe to call more than once per process.
+    """
+    global _election_started
+    with _election_guard:
+        if _election_started:
+            return
+        _election_started = True
+
+    def campaign():
+        while not try_acquire_leadership():
+            time.sleep(LEADER_RETRY_SECONDS)
+        logging.info(f"Process {os.getpid()} is the background-task leader.")
+        on_elected()
+
+    threading.Thread(target=campaign, daemon=True, name="leader-election").start()
@@ -0,0 +1,50 @@
+"""Initial schema: competitors and articles
+
+Revision ID: 0001_initial
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001_initial'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'competitors',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('rss', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_competitors_id', 'competitors', ['id'])
+    op.create_index('ix_competitors_name', 'competitors', ['name'], unique=True)
+
+    op.create_table(
+        'articles',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('competitor', sa.String(), nullable=False),
+        sa.Column('url', sa.String(), nullable=False, unique=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('published', sa.DateTime(), nullable=True),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('url', name='_article_url_uc'),
+    )
+    op.create_index('ix_articles_id', 'articles', ['id'])
+    op.create_index('ix_articles_competitor', 'articles', ['competitor'])
+    op.create_index('ix_articles_status', 'articles', ['status'])
+
+
+def downgrade():
+    op.drop_table('articles')
+    op.drop_table('competitors')
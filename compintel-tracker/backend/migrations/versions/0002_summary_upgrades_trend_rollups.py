@@ -0,0 +1,43 @@
+"""Summary upgrade queue and trend rollups
+
+Revision ID: 0002_summary_upgrades_trend_rollups
+Revises: 0001_initial
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002_summary_upgrades_trend_rollups'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # These tables may already exist on databases that ran create_all() before migrations
+    existing = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'summary_upgrades' not in existing:
+        op.create_table(
+            'summary_upgrades',
+            sa.Column('article_id', sa.Integer(), primary_key=True),
+            sa.Column('queued_at', sa.DateTime(), nullable=True),
+            sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        )
+        op.create_index('ix_summary_upgrades_queued_at', 'summary_upgrades', ['queued_at'])
+
+    if 'trend_rollups' not in existing:
+        op.create_table(
+            'trend_rollups',
+            sa.Column('day', sa.Date(), primary_key=True),
+            sa.Column('competitor', sa.String(), primary_key=True),
+            sa.Column('category', sa.String(), primary_key=True),
+            sa.Column('severity', sa.String(), primary_key=True),
+            sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        )
+
+
+def downgrade():
+    op.drop_table('trend_rollups')
+    op.drop_table('summary_upgrades')
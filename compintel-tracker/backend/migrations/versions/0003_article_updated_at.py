@@ -0,0 +1,27 @@
+"""Article.updated_at for incremental insights sync
+
+Revision ID: 0003_article_updated_at
+Revises: 0002_summary_upgrades_trend_rollups
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003_article_updated_at'
+down_revision = '0002_summary_upgrades_trend_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('articles', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    # Existing rows have not changed since they were fetched
+    op.execute("UPDATE articles SET updated_at = fetched_at")
+    op.create_index('ix_articles_updated_at', 'articles', ['updated_at'])
+
+
+def downgrade():
+    op.drop_index('ix_articles_updated_at', table_name='articles')
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.drop_column('updated_at')
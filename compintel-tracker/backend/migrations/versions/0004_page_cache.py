@@ -0,0 +1,33 @@
+"""Raw page cache index
+
+Revision ID: 0004_page_cache
+Revises: 0003_article_updated_at
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0004_page_cache'
+down_revision = '0003_article_updated_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'page_cache',
+        sa.Column('url', sa.String(), primary_key=True),
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('raw_bytes', sa.Integer(), nullable=False),
+        sa.Column('stored_bytes', sa.Integer(), nullable=False),
+        sa.Column('content_type', sa.String(), nullable=True),
+        sa.Column('encoding', sa.String(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_page_cache_sha256', 'page_cache', ['sha256'])
+    op.create_index('ix_page_cache_fetched_at', 'page_cache', ['fetched_at'])
+
+
+def downgrade():
+    op.drop_table('page_cache')
@@ -0,0 +1,34 @@
+"""Published source health (circuit-breaker) state
+
+Revision ID: 0005_source_health
+Revises: 0004_page_cache
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0005_source_health'
+down_revision = '0004_page_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'source_health',
+        sa.Column('host', sa.String(), primary_key=True),
+        sa.Column('state', sa.String(), nullable=False),
+        sa.Column('consecutive_failures', sa.Integer(), nullable=False),
+        sa.Column('trips', sa.Integer(), nullable=False),
+        sa.Column('retry_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('last_failure_at', sa.DateTime(), nullable=True),
+        sa.Column('successes', sa.Integer(), nullable=False),
+        sa.Column('failures', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table('source_health')
@@ -0,0 +1,28 @@
+"""Tombstones for hard-deleted articles (insights delta sync)
+
+Revision ID: 0006_article_tombstones
+Revises: 0005_source_health
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006_article_tombstones'
+down_revision = '0005_source_health'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'article_tombstones',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_article_tombstones_deleted_at', 'article_tombstones', ['deleted_at'])
+
+
+def downgrade():
+    op.drop_table('article_tombstones')
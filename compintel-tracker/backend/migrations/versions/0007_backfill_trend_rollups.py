@@ -0,0 +1,33 @@
+"""Backfill trend rollups from existing articles
+
+Revision ID: 0007_backfill_trend_rollups
+Revises: 0006_article_tombstones
+Create Date: 2026-10-19
+
+Runs once per database before any worker starts (init_db() in gunicorn's on_starting),
+so nothing can ingest while the counts are rebuilt. This replaces the old startup-time
+backfill, which only ran while trend_rollups was empty and raced with ingest.
+"""
+from alembic import op
+from sqlalchemy.orm import Session
+
+
+revision = '0007_backfill_trend_rollups'
+down_revision = '0006_article_tombstones'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Same bucketing rules as ingest (classifier.py), applied to every stored article
+    from trends import rebuild_rollups
+
+    session = Session(bind=op.get_bind())
+    try:
+        rebuild_rollups(session, commit=False)   # Alembic commits the migration transaction
+    finally:
+        session.close()
+
+
+def downgrade():
+    pass   # Rollups are derived data; nothing to undo
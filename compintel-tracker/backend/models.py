@@ -1,16 +1,18 @@
 # backend/models.py
 
 from sqlalchemy import (
-    Column, Integer, String, Text, DateTime,
+    Column, Integer, String, Text, DateTime, Date,
     UniqueConstraint
 )
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy import create_engine
 import datetime
+import os
 
 # --- Configuration ---
 Base = declarative_base()
-DATABASE_URL = "sqlite:///compintel.db"
+# Override with the DATABASE_URL env var (e.g. Postgres on Render, a scratch DB for benchmarks)
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///compintel.db")
 engine = create_engine(DATABASE_URL, echo=False, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
@@ -48,6 +50,8 @@ class Article(Base):
     summary = Column(Text)
     status = Column(String, default='pending', index=True)
     fetched_at = Column(DateTime, default=datetime.datetime.utcnow)
+    # Bumped on every ORM update (status, summary upgrades); drives /api/insights?updated_since=
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, index=True)
 
     __table_args__ = (
         UniqueConstraint('url', name='_article_url_uc'),
@@ -56,10 +60,113 @@ class Article(Base):
     def __repr__(self):
         return f"<Article(title='{self.title[:30]}...', status='{self.status}')>"
 
+class SummaryUpgrade(Base):
+    """
+    Queue of articles summarized by the local (extractive) tier, waiting for an LLM summary.
+    """
+    __tablename__ = 'summary_upgrades'
+
+    article_id = Column(Integer, primary_key=True)
+    queued_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<SummaryUpgrade(article_id={self.article_id}, attempts={self.attempts})>"
+
+class TrendRollup(Base):
+    """
+    Daily article counts per competitor/category/severity, maintained incrementally at ingest
+    so /api/trends never has to scan `articles`.
+    """
+    __tablename__ = 'trend_rollups'
+
+    day = Column(Date, primary_key=True)
+    competitor = Column(String, primary_key=True)
+    category = Column(String, primary_key=True)
+    severity = Column(String, primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<TrendRollup({self.day} {self.competitor}/{self.category}/{self.severity}={self.count})>"
+
+class CachedPage(Base):
+    """
+    Index of the raw page cache: which compressed blob (by SHA-256 of the body) holds the
+    last download of each article URL. The blobs themselves live on disk (see page_cache.py).
+    """
+    __tablename__ = 'page_cache'
+
+    url = Column(String, primary_key=True)
+    sha256 = Column(String(64), index=True, nullable=False)
+    raw_bytes = Column(Integer, nullable=False)
+    stored_bytes = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=True)
+    encoding = Column(String, nullable=True)
+    fetched_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<CachedPage(url='{self.url}', sha256='{self.sha256[:12]}')>"
+
+class SourceHealth(Base):
+    """
+    Last published circuit-breaker state per host. Breakers live in the memory of the
+    process that fetches (see source_health.py); this table lets every worker report them.
+    """
+    __tablename__ = 'source_health'
+
+    host = Column(String, primary_key=True)
+    state = Column(String, nullable=False, default='closed')
+    consecutive_failures = Column(Integer, default=0, nullable=False)
+    trips = Column(Integer, default=0, nullable=False)
+    retry_at = Column(DateTime, nullable=True)      # End of the cool-down while the breaker is open
+    last_error = Column(String, nullable=True)
+    last_failure_at = Column(DateTime, nullable=True)
+    successes = Column(Integer, default=0, nullable=False)
+    failures = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<SourceHealth(host='{self.host}', state='{self.state}')>"
+
+class ArticleTombstone(Base):
+    """
+    Ids of hard-deleted articles, so /api/insights?updated_since= can tell clients to drop
+    them. Pruned after a retention window; older cursors get a full reload instead.
+    """
+    __tablename__ = 'article_tombstones'
+
+    id = Column(Integer, primary_key=True)
+    article_id = Column(Integer, nullable=False)   # Not unique: SQLite may reuse a deleted id
+    deleted_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<ArticleTombstone(article_id={self.article_id}, deleted_at={self.deleted_at})>"
+
 # --- Database Initialization ---
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+BASELINE_REVISION = "0001_initial"  # Schema the old create_all() path produced
+
+
 def init_db():
+    """
+    Brings the schema up to date by running the Alembic migrations. Run once per deploy/start
+    (gunicorn's on_starting hook or `python app.py`), not on import or in every worker.
+    """
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import inspect
+
     print(f"Initializing database at {DATABASE_URL}")
-    Base.metadata.create_all(bind=engine)
+    cfg = Config()
+    cfg.set_main_option("script_location", MIGRATIONS_DIR)
+
+    tables = inspect(engine).get_table_names()
+    if 'articles' in tables and 'alembic_version' not in tables:
+        # Database created before migrations existed: adopt it at the baseline revision
+        command.stamp(cfg, BASELINE_REVISION)
+    command.upgrade(cfg, "head")
+    # Called in gunicorn's master before the fork: workers must not inherit its pooled connection
+    engine.dispose()
     print("Database initialization complete.")
 
 if __name__ == '__main__':
@@ -0,0 +1,169 @@
+import os
+import zlib
+import hashlib
+import datetime
+import logging
+import threading
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from models import SessionLocal, CachedPage
+
+# ----------------------------------------------------------------------
+# --- RAW PAGE CACHE (Compressed, Content-Addressed, Size-Bounded) ---
+# ----------------------------------------------------------------------
+
+PAGE_CACHE_DIR = os.environ.get(
+    "PAGE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "page_cache")
+)
+PAGE_CACHE_MAX_BYTES = int(os.environ.get("PAGE_CACHE_MAX_BYTES", 512 * 1024 * 1024))  # 0 disables the cache
+PAGE_CACHE_EVICT_TO = 0.9        # Eviction frees space down to this fraction of the limit
+PAGE_CACHE_ZLIB_LEVEL = 6        # HTML compresses ~5-8x at this level for little CPU
+PAGE_CACHE_CHECK_FRACTION = 0.01 # Size check (a GROUP BY over the index) after every 1% of the limit written
+
+_unchecked_bytes = 0
+_unchecked_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return PAGE_CACHE_MAX_BYTES > 0
+
+
+def blob_path(sha256: str) -> str:
+    """Blobs are named by the SHA-256 of the raw body: identical pages are stored once."""
+    return os.path.join(PAGE_CACHE_DIR, "objects", sha256[:2], sha256[2:] + ".z")
+
+
+def read_blob(sha256: str) -> bytes:
+    """Raw body for a blob. Raises FileNotFoundError if it was evicted or the disk was wiped."""
+    with open(blob_path(sha256), "rb") as f:
+        return zlib.decompress(f.read())
+
+
+def decode_body(body: bytes, encoding: str) -> str:
+    """Same decoding as requests' Response.text, so cached and live pages extract identically."""
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except LookupError:
+        return str(body, "utf-8", errors="replace")
+
+
+def _write_blob(sha256: str, body: bytes) -> int:
+    path = blob_path(sha256)
+    if os.path.exists(path):
+        return os.path.getsize(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(zlib.compress(body, PAGE_CACHE_ZLIB_LEVEL))
+    os.replace(tmp, path)  # Atomic: readers never see a partial blob
+    return os.path.getsize(path)
+
+
+def store_page(url: str, body: bytes, content_type: str = None, encoding: str = None):
+    """
+    Caches the raw body of a successful article download. Never raises: the cache is an
+    optimization, so a full disk or a locked database only logs a warning.
+    """
+    if not cache_enabled() or not body:
+        return
+    db = SessionLocal()
+    try:
+        sha256 = hashlib.sha256(body).hexdigest()
+        stored_bytes = _write_blob(sha256, body)
+        previous = db.get(CachedPage, url)
+        replaced = previous.sha256 if previous is not None and previous.sha256 != sha256 else None
+        db.merge(CachedPage(
+            url=url, sha256=sha256, raw_bytes=len(body), stored_bytes=stored_bytes,
+            content_type=content_type, encoding=encoding, fetched_at=datetime.datetime.utcnow()
+        ))
+        db.commit()
+        if replaced:
+            _remove_if_unreferenced(db, replaced)
+        if _due_for_size_check(stored_bytes):
+            evict(db)
+    except IntegrityError:
+        db.rollback()   # Same URL stored concurrently by another thread: either copy is fine
+    except Exception as e:
+        db.rollback()
+        logging.warning(f"Could not cache page {url}: {e}")
+    finally:
+        db.close()
+
+
+def _due_for_size_check(written: int) -> bool:
+    """Per process, so the cache can overshoot by PAGE_CACHE_CHECK_FRACTION per worker at most."""
+    global _unchecked_bytes
+    with _unchecked_lock:
+        _unchecked_bytes += written
+        if _unchecked_bytes < PAGE_CACHE_MAX_BYTES * PAGE_CACHE_CHECK_FRACTION:
+            return False
+        _unchecked_bytes = 0
+        return True
+
+
+def _remove_if_unreferenced(db, sha256: str) -> bool:
+    if db.query(CachedPage.url).filter(CachedPage.sha256 == sha256).first() is not None:
+        return False
+    try:
+        os.remove(blob_path(sha256))
+    except FileNotFoundError:
+        pass
+    return True
+
+
+def cached_bytes(db) -> int:
+    """On-disk size of the cache (each blob counted once, however many URLs share it)."""
+    per_blob = select(func.max(CachedPage.stored_bytes).label("size")).group_by(CachedPage.sha256).subquery()
+    return int(db.execute(select(func.coalesce(func.sum(per_blob.c.size), 0))).scalar())
+
+
+def evict(db, max_bytes: int = None) -> int:
+    """
+    Drops the oldest cached pages until the cache is under PAGE_CACHE_EVICT_TO of `max_bytes`
+    (default PAGE_CACHE_MAX_BYTES). A blob is deleted once no URL refers to it.
+    Returns the number of bytes freed.
+    """
+    max_bytes = PAGE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    total = cached_bytes(db)
+    if total <= max_bytes:
+        return 0
+
+    target = int(max_bytes * PAGE_CACHE_EVICT_TO)
+    freed = 0
+    while total - freed > target:
+        oldest = db.query(CachedPage).order_by(CachedPage.fetched_at, CachedPage.url).limit(100).all()
+        if not oldest:
+            break
+        for entry in oldest:
+            db.delete(entry)
+            db.flush()
+            if _remove_if_unreferenced(db, entry.sha256):
+                freed += entry.stored_bytes
+            if total - freed <= target:
+                break
+        db.commit()
+
+    logging.info(f"Page cache eviction freed {freed} bytes ({total} -> {total - freed}).")
+    return freed
+
+
+def cache_stats(db) -> dict:
+    pages, raw = db.query(func.count(CachedPage.url), func.coalesce(func.sum(CachedPage.raw_bytes), 0)).one()
+    return {
+        "pages": pages,
+        "blobs": db.query(func.count(func.distinct(CachedPage.sha256))).scalar(),
+        "raw_bytes": int(raw),
+        "stored_bytes": cached_bytes(db),
+        "max_bytes": PAGE_CACHE_MAX_BYTES,
+        "directory": PAGE_CACHE_DIR,
+    }
+
+
+if __name__ == '__main__':
+    db = SessionLocal()
+    try:
+        freed = evict(db)
+        print(f"Freed {freed} bytes. {cache_stats(db)}")
+    finally:
+        db.close()
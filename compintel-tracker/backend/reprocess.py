@@ -0,0 +1,202 @@
+# backend/reprocess.py
+
+"""
+Re-runs extraction and/or summarization over stored articles without touching the network.
+
+    python reprocess.py --extract                      # after changing extract_text_from_html()
+    python reprocess.py --summarize llm                # after changing PROMPT_TEMPLATE / OLLAMA_MODEL
+    python reprocess.py --extract --summarize local --competitor TechCrunch --since 2026-01-01
+
+--extract re-parses the raw pages kept by page_cache.py (articles without a cached page are
+skipped). --summarize re-summarizes the (re-)extracted text: `llm` goes through the tiered
+summarizer now (bounded by Ollama's throughput), `local` writes extractive summaries in
+seconds and queues every article for the background LLM upgrader.
+"""
+
+import os
+import json
+import datetime
+import argparse
+import logging
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import select, update
+
+from models import SessionLocal, engine, Article, CachedPage, SummaryUpgrade
+from trends import article_dimensions, move_article
+
+REPROCESS_BATCH_SIZE = 500       # Articles per round trip (read, fan out, one bulk UPDATE)
+SUMMARIZE_MODES = ('llm', 'local')
+
+
+def _init_worker():
+    # Forked workers must not reuse (and on exit close) the parent's pooled DB connections
+    engine.dispose(close=False)
+
+
+def _reprocess_one(task: dict) -> dict:
+    """Runs in a worker process: CPU-bound parsing/ranking, no database access."""
+    # Imported here so each worker pays for the scraping/LLM stacks only once (the parent only needs them for `llm`)
+    from fetcher import extract_text_from_html
+    from page_cache import read_blob, decode_body
+    from summarizer import summarize_locally, summarize_tiered
+
+    result = {"id": task["id"]}
+    try:
+        content = task["content"]
+        if task["sha256"] is not None:
+            content = extract_text_from_html(decode_body(read_blob(task["sha256"]), task["encoding"]))
+            result["content"] = content
+
+        if task["summarize"] == 'local':
+            summary, result["tier"] = summarize_locally(content or ""), 'local'
+        elif task["summarize"] == 'llm':
+            summary, result["tier"] = summarize_tiered(content or "")
+        else:
+            return result
+        result["summary"] = json.dumps({
+            "insight": summary.get('insight', 'N/A'),
+            "bullets": summary.get('bullets', []),
+            "tags": summary.get('tags', [])
+        })
+    except FileNotFoundError:
+        result["missing"] = True    # Blob evicted since the index was read
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _select_batch(db, after_id: int, extract: bool, competitor: str, since, limit: int):
+    columns = [Article.id, Article.competitor, Article.title, Article.url, Article.status,
+               Article.fetched_at, Article.content, Article.summary, CachedPage.sha256, CachedPage.encoding]
+    query = select(*columns).where(Article.id > after_id)
+    # Keyset batches (no long-lived read cursor while this process writes between batches)
+    if extract:
+        query = query.join(CachedPage, CachedPage.url == Article.url)
+    else:
+        query = query.outerjoin(CachedPage, CachedPage.url == Article.url)
+    if competitor:
+        query = query.where(Article.competitor == competitor)
+    if since:
+        query = query.where(Article.fetched_at >= since)
+    return db.execute(query.order_by(Article.id).limit(limit)).all()
+
+
+def _apply_batch(db, rows_by_id: dict, results: list, stats: dict):
+    """Bulk-updates the changed articles, their trend buckets and the LLM upgrade queue (caller commits)."""
+    now = datetime.datetime.utcnow()
+    changes, upgraded, to_queue = [], [], []
+
+    for result in results:
+        if result.get("missing"):
+            stats["missing"] += 1
+            continue
+        if result.get("error"):
+            stats["errors"] += 1
+            logging.warning(f"Reprocessing article {result['id']} failed: {result['error']}")
+            continue
+
+        row = rows_by_id[result["id"]]
+        change = {}
+        if "content" in result and result["content"] != row.content:
+            change["content"] = result["content"]
+        if "summary" in result and result["summary"] != row.summary:
+            change["summary"] = result["summary"]
+            # Same re-bucketing as the LLM upgrader: the summary drives category/severity
+            move_article(db, article_dimensions(row), SimpleNamespace(**{**row._asdict(), "summary": result["summary"]}))
+        if result.get("tier") == 'local':
+            to_queue.append(result["id"])
+        elif result.get("tier") == 'llm':
+            upgraded.append(result["id"])
+
+        if change:
+            changes.append({"id": result["id"], "updated_at": now, **change})
+        else:
+            stats["unchanged"] += 1
+
+    if changes:
+        # Grouped by key set: rows where only the summary changed don't rewrite `content`
+        for keys in {tuple(sorted(c)) for c in changes}:
+            db.execute(update(Article), [c for c in changes if tuple(sorted(c)) == keys])
+    if upgraded:
+        db.query(SummaryUpgrade).filter(SummaryUpgrade.article_id.in_(upgraded)).delete(synchronize_session=False)
+    if to_queue:
+        queued = {a for (a,) in db.query(SummaryUpgrade.article_id).filter(SummaryUpgrade.article_id.in_(to_queue))}
+        db.add_all(SummaryUpgrade(article_id=a) for a in to_queue if a not in queued)
+    stats["updated"] += len(changes)
+    stats["queued_for_llm"] += len(to_queue)
+
+
+def reprocess_articles(extract: bool = True, summarize: str = None, competitor: str = None, since=None,
+                       workers: int = None, batch_size: int = REPROCESS_BATCH_SIZE, dry_run: bool = False) -> dict:
+    """
+    Re-extracts (from the page cache) and/or re-summarizes matching articles across a pool of
+    worker processes, writing only rows whose content or summary actually changed.
+    Returns counters: processed, updated, unchanged, missing, errors, queued_for_llm.
+    """
+    if not extract and not summarize:
+        raise ValueError("Nothing to do: pass extract=True and/or summarize='llm'|'local'.")
+    if summarize not in (None,) + SUMMARIZE_MODES:
+        raise ValueError(f"summarize must be one of {SUMMARIZE_MODES}.")
+
+    stats = {"processed": 0, "updated": 0, "unchanged": 0, "missing": 0, "errors": 0, "queued_for_llm": 0}
+    workers = workers or os.cpu_count() or 1
+    if summarize == 'llm':
+        from summarizer import LLM_MAX_CONCURRENCY
+        # Each process has its own LLM semaphore and runs one task at a time: processes = Ollama calls in flight
+        if workers > LLM_MAX_CONCURRENCY:
+            logging.info(f"Limiting workers to LLM_MAX_CONCURRENCY={LLM_MAX_CONCURRENCY} for --summarize llm.")
+            workers = LLM_MAX_CONCURRENCY
+    db = SessionLocal()
+    after_id = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            while True:
+                rows = _select_batch(db, after_id, extract, competitor, since, batch_size)
+                if not rows:
+                    break
+                after_id = rows[-1].id
+                tasks = [{
+                    "id": r.id,
+                    "sha256": r.sha256 if extract else None,
+                    "encoding": r.encoding,
+                    # Workers only need the stored text when they are not re-extracting it
+                    "content": None if extract else r.content,
+                    "summarize": summarize,
+                } for r in rows]
+                results = list(pool.map(_reprocess_one, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+                stats["processed"] += len(rows)
+
+                _apply_batch(db, {r.id: r for r in rows}, results, stats)
+                if dry_run:
+                    db.rollback()   # Counters are still reported
+                else:
+                    db.commit()
+                logging.info(f"Reprocessed through article {after_id}: {stats}")
+    finally:
+        db.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run extraction/summarization over cached pages.")
+    parser.add_argument("--extract", action="store_true", help="Re-extract article text from the page cache.")
+    parser.add_argument("--summarize", choices=SUMMARIZE_MODES, default=None, help="Re-summarize the article text.")
+    parser.add_argument("--competitor", default=None)
+    parser.add_argument("--since", default=None, help="Only articles fetched on/after this date (YYYY-MM-DD).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count; at most LLM_MAX_CONCURRENCY with --summarize llm).")
+    parser.add_argument("--batch-size", type=int, default=REPROCESS_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Process everything but write nothing.")
+    args = parser.parse_args()
+    if not args.extract and not args.summarize:
+        parser.error("pass --extract and/or --summarize")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    since = datetime.datetime.fromisoformat(args.since) if args.since else None
+    stats = reprocess_articles(args.extract, args.summarize, args.competitor, since,
+                               args.workers, args.batch_size, args.dry_run)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
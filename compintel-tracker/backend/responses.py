@@ -0,0 +1,123 @@
+import os
+import gzip
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+# Optional accelerators: everything falls back to the stdlib when they are missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ----------------------------------------------------------------------
+# --- FAST JSON SERIALIZATION ---
+# ----------------------------------------------------------------------
+
+JSON_BACKEND = os.environ.get("JSON_BACKEND", "orjson" if orjson else "json")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (sorted keys, like the default provider).
+    Types orjson does not handle natively go through Flask's default hook. Note that
+    orjson writes datetimes as ISO 8601 rather than Flask's RFC 822 format.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get("indent") is not None)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # Bytes straight into the response: no str round-trip
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+# ----------------------------------------------------------------------
+# --- NEGOTIATED RESPONSE COMPRESSION (brotli > gzip) ---
+# ----------------------------------------------------------------------
+
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", 1024))   # Smaller bodies aren't worth the CPU
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5       # Roughly gzip -6 CPU cost for a noticeably smaller body on JSON
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/css', 'text/plain',
+                          'text/csv', 'application/javascript', 'application/x-ndjson')
+
+
+def _accepted_encodings() -> dict:
+    """Parses Accept-Encoding into {coding: q}."""
+    accepted = {}
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.lower()] = q
+    return accepted
+
+
+def choose_encoding() -> str:
+    accepted = _accepted_encodings()
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+
+def compress_response(response):
+    """after_request hook: compresses large, compressible, non-streamed bodies."""
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding()
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_BYTES:
+        return response
+
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Content-Length'] = str(len(compressed))
+    return response
+
+
+def init_responses(app):
+    """Installs the JSON provider selected by JSON_BACKEND and the compression hook."""
+    if JSON_BACKEND == "orjson" and orjson is not None:
+        app.json = OrjsonProvider(app)
+    app.after_request(compress_response)
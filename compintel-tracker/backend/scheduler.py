@@ -0,0 +1,150 @@
+import os
+import time
+import heapq
+import random
+import logging
+import threading
+
+from models import SessionLocal, Competitor
+from ingest import ingest_competitor
+
+# ----------------------------------------------------------------------
+# --- POLLING CONFIGURATION (Overridable through the environment) ---
+# ----------------------------------------------------------------------
+
+POLL_MIN_INTERVAL = int(os.environ.get("POLL_MIN_INTERVAL", 10 * 60))          # 10 minutes
+POLL_MAX_INTERVAL = int(os.environ.get("POLL_MAX_INTERVAL", 24 * 3600))        # 1 day
+POLL_INITIAL_INTERVAL = int(os.environ.get("POLL_INITIAL_INTERVAL", 3600))     # 1 hour
+POLL_BACKOFF_FACTOR = 1.5        # Interval multiplier after a poll with no new entries (or an error)
+POLL_TARGET_NEW_PER_POLL = 2.0   # Aim to see about this many new entries per poll on active feeds
+POLL_RATE_SMOOTHING = 0.3        # EWMA weight of the newest publish-rate sample
+POLL_RSS_LIMIT = 10              # Entries inspected per poll (only unseen ones are scraped)
+POLL_RESYNC_SECONDS = 300        # How often the competitor list is re-read from the DB
+
+
+# ----------------------------------------------------------------------
+# --- ADAPTIVE FEED SCHEDULER ---
+# ----------------------------------------------------------------------
+
+class FeedState:
+    """Per-feed polling state; `rate` is the smoothed publish rate in new entries per second."""
+
+    def __init__(self, name: str, rss: str, website: str):
+        self.name = name
+        self.rss = rss
+        self.website = website
+        self.interval = POLL_INITIAL_INTERVAL
+        self.rate = 0.0
+        self.last_polled = None
+        self.next_due = 0.0
+        self.consecutive_errors = 0
+
+    def update(self, new_entries: int, now: float, saturated: bool = False):
+        """Adapts the interval to the observed publish rate, within the configured bounds."""
+        first_poll = self.last_polled is None
+        if not first_poll:
+            elapsed = max(now - self.last_polled, 1.0)
+            sample = new_entries / elapsed
+            self.rate = POLL_RATE_SMOOTHING * sample + (1 - POLL_RATE_SMOOTHING) * self.rate
+        self.last_polled = now
+
+        if new_entries == 0:
+            self.interval *= POLL_BACKOFF_FACTOR
+        elif saturated and not first_poll:
+            # Every inspected entry was new, so some were probably missed: halve straight away
+            self.interval /= 2
+        elif self.rate > 0:
+            self.interval = POLL_TARGET_NEW_PER_POLL / self.rate
+
+        self.interval = min(max(self.interval, POLL_MIN_INTERVAL), POLL_MAX_INTERVAL)
+        self.next_due = now + self.interval
+
+
+class FeedScheduler:
+    """
+    Polls every competitor feed from a min-heap keyed on each feed's next-due time.
+    Feeds added or removed through the API are picked up on the next resync.
+    """
+
+    def __init__(self, poll=None):
+        self.feeds = {}
+        self.queue = []   # (next_due, seq, name)
+        self._seq = 0
+        self._stop = threading.Event()
+        self._poll = poll or self._ingest
+        self._last_resync = 0.0
+
+    def _push(self, feed: FeedState):
+        self._seq += 1
+        heapq.heappush(self.queue, (feed.next_due, self._seq, feed.name))
+
+    def resync(self, now: float):
+        """Adds new competitors (spread over the first minute) and forgets deleted ones."""
+        db = SessionLocal()
+        try:
+            competitors = db.query(Competitor).filter(Competitor.rss.isnot(None)).all()
+            current = {c.name: c for c in competitors if c.rss}
+        finally:
+            db.close()
+
+        for name in list(self.feeds):
+            if name not in current:
+                del self.feeds[name]  # Stale heap entries are skipped when popped
+
+        for name, c in current.items():
+            feed = self.feeds.get(name)
+            if feed is None:
+                feed = FeedState(name, c.rss, c.website)
+                feed.next_due = now + random.uniform(0, 60)
+                self.feeds[name] = feed
+                self._push(feed)
+            else:
+                feed.rss, feed.website = c.rss, c.website
+        self._last_resync = now
+
+    def _ingest(self, feed: FeedState) -> int:
+        db = SessionLocal()
+        try:
+            comp = {"name": feed.name, "rss": feed.rss, "website": feed.website}
+            result = ingest_competitor(db, comp, rss_limit=POLL_RSS_LIMIT, workers=3)
+            return result["new_articles"]
+        finally:
+            db.close()
+
+    def run_due(self, now: float):
+        """Polls every feed whose next-due time has passed."""
+        while self.queue and self.queue[0][0] <= now and not self._stop.is_set():
+            due, _, name = heapq.heappop(self.queue)
+            feed = self.feeds.get(name)
+            if feed is None or due != feed.next_due:
+                continue
+
+            try:
+                new_entries = self._poll(feed)
+                feed.consecutive_errors = 0
+                feed.update(new_entries, time.time(), saturated=new_entries >= POLL_RSS_LIMIT)
+                logging.info(f"Polled {name}: {new_entries} new, next poll in {feed.interval / 60:.0f} min.")
+            except Exception as e:
+                feed.consecutive_errors += 1
+                feed.update(0, time.time())
+                logging.error(f"Polling {name} failed ({feed.consecutive_errors} in a row): {e}")
+            self._push(feed)
+            now = time.time()
+
+    def run_forever(self):
+        logging.info("Feed polling scheduler started.")
+        while not self._stop.is_set():
+            now = time.time()
+            try:
+                if now - self._last_resync >= POLL_RESYNC_SECONDS:
+                    self.resync(now)
+                self.run_due(now)
+            except Exception as e:
+                logging.error(f"Feed scheduler loop error: {e}")
+
+            next_due = self.queue[0][0] if self.queue else now + POLL_RESYNC_SECONDS
+            wake_at = min(next_due, self._last_resync + POLL_RESYNC_SECONDS)
+            self._stop.wait(max(wake_at - time.time(), 1.0))
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,238 @@
+import os
+import time
+import logging
+import datetime
+import threading
+from urllib.parse import urlparse
+
+import requests
+
+from models import SessionLocal, SourceHealth
+
+# ----------------------------------------------------------------------
+# --- PER-HOST HEALTH: CIRCUIT BREAKER + TOKEN-BUCKET RATE LIMIT ---
+# ----------------------------------------------------------------------
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", 3))   # Consecutive failures before tripping
+BREAKER_COOLDOWN_SECONDS = float(os.environ.get("BREAKER_COOLDOWN_SECONDS", 300))  # First cool-down after a trip
+BREAKER_MAX_COOLDOWN_SECONDS = 6 * 3600                                            # Cool-down doubles per re-trip up to this
+HOST_RATE_PER_SECOND = float(os.environ.get("HOST_RATE_PER_SECOND", 1.0))          # Sustained requests per host
+HOST_RATE_BURST = float(os.environ.get("HOST_RATE_BURST", 3))                      # Bucket capacity
+RATE_LIMIT_MAX_WAIT = 10.0       # Give up instead of queueing longer than this for a token
+REQUEST_TIMEOUT = (5, 15)        # (connect, read) seconds
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
+class SourceUnavailable(Exception):
+    """Raised instead of making a request when the host's breaker is open or it is rate limited."""
+
+
+class HostHealth:
+    """Breaker + token bucket for a single host. Guarded by SourceHealthRegistry's lock."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = "closed"            # closed -> open -> half_open -> closed/open
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.last_error = None
+        self.last_failure_at = None
+        self.successes = 0
+        self.failures = 0
+        self.published_successes = 0     # Counters already added to the source_health table
+        self.published_failures = 0
+        self.tokens = HOST_RATE_BURST
+        self.refilled_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(HOST_RATE_BURST, self.tokens + (now - self.refilled_at) * HOST_RATE_PER_SECOND)
+        self.refilled_at = now
+
+    def to_dict(self) -> dict:
+        return {
+            "host": self.host,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "retry_in_seconds": round(max(self.open_until - time.monotonic(), 0)) if self.state == "open" else 0,
+            "last_error": self.last_error,
+            "last_failure_at": self.last_failure_at,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
+class SourceHealthRegistry:
+    """
+    Tracks every host the fetcher talks to. Breakers are enforced per process (the polling
+    leader does most fetching); publish() copies the hosts this process has touched into the
+    source_health table, which is what /api/sources/health reads in every worker.
+    """
+
+    def __init__(self):
+        self._hosts = {}
+        self._dirty = set()      # Hosts changed since the last publish()
+        self._lock = threading.Lock()
+
+    def _get(self, host: str) -> HostHealth:
+        h = self._hosts.get(host)
+        if h is None:
+            h = self._hosts[host] = HostHealth(host)
+        return h
+
+    def acquire(self, host: str):
+        """Checks the breaker and takes a rate-limit token, sleeping briefly if needed."""
+        deadline = time.monotonic() + RATE_LIMIT_MAX_WAIT
+        while True:
+            with self._lock:
+                h = self._get(host)
+                now = time.monotonic()
+                if h.state == "open" and now < h.open_until:
+                    raise SourceUnavailable(f"Circuit open for {host} ({h.last_error})")
+                if h.state == "half_open":
+                    raise SourceUnavailable(f"Circuit half-open for {host}, trial request in flight")
+                h._refill(now)
+                if h.tokens >= 1:
+                    h.tokens -= 1
+                    if h.state == "open":
+                        self._dirty.add(host)
+                        h.state = "half_open"   # Cool-down over: this caller is the single trial request
+                    return
+                wait = (1 - h.tokens) / HOST_RATE_PER_SECOND
+            if now + wait > deadline:
+                raise SourceUnavailable(f"Rate limit for {host} exceeded")
+            time.sleep(wait)
+
+    def record_success(self, host: str):
+        with self._lock:
+            h = self._get(host)
+            self._dirty.add(host)
+            h.successes += 1
+            h.consecutive_failures = 0
+            if h.state != "closed":
+                h.state = "closed"
+                h.trips = 0
+
+    def record_failure(self, host: str, error: str):
+        with self._lock:
+            h = self._get(host)
+            self._dirty.add(host)
+            h.failures += 1
+            h.consecutive_failures += 1
+            h.last_error = error[:200]
+            h.last_failure_at = datetime.datetime.utcnow()
+            if h.state == "half_open" or h.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+                cooldown = min(BREAKER_COOLDOWN_SECONDS * (2 ** h.trips), BREAKER_MAX_COOLDOWN_SECONDS)
+                h.trips += 1
+                h.state = "open"
+                h.open_until = time.monotonic() + cooldown
+
+    def snapshot(self, unhealthy_only: bool = True) -> list:
+        with self._lock:
+            hosts = [h.to_dict() for h in self._hosts.values()]
+        if unhealthy_only:
+            hosts = [h for h in hosts if h["state"] != "closed" or h["consecutive_failures"] > 0]
+        return sorted(hosts, key=lambda h: h["host"])
+
+    def publish(self) -> int:
+        """
+        Upserts the hosts changed since the last call into source_health. State columns are
+        overwritten (the last process to touch a host wins); success/failure counters are
+        added, so they total across processes. Never raises. Returns the hosts written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return 0
+            now, wall_now = time.monotonic(), datetime.datetime.utcnow()
+            pending = []
+            for host in self._dirty:
+                h = self._hosts[host]
+                row = h.to_dict()
+                row["retry_at"] = (wall_now + datetime.timedelta(seconds=h.open_until - now)
+                                   if h.state == "open" else None)
+                row["new_successes"] = h.successes - h.published_successes
+                row["new_failures"] = h.failures - h.published_failures
+                pending.append((h, row))
+            self._dirty.clear()
+
+        db = SessionLocal()
+        try:
+            for h, row in pending:
+                entry = db.get(SourceHealth, row["host"]) or SourceHealth(host=row["host"], successes=0, failures=0)
+                entry.state = row["state"]
+                entry.consecutive_failures = row["consecutive_failures"]
+                entry.trips = row["trips"]
+                entry.retry_at = row["retry_at"]
+                entry.last_error = row["last_error"]
+                entry.last_failure_at = row["last_failure_at"]
+                entry.successes += row["new_successes"]
+                entry.failures += row["new_failures"]
+                entry.updated_at = wall_now
+                db.add(entry)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                self._dirty.update(h.host for h, _ in pending)   # Retried on the next publish
+            logging.warning(f"Could not publish source health: {e}")
+            return 0
+        finally:
+            db.close()
+
+        with self._lock:
+            for h, row in pending:
+                h.published_successes += row["new_successes"]
+                h.published_failures += row["new_failures"]
+        return len(pending)
+
+
+def published_snapshot(db, unhealthy_only: bool = True) -> list:
+    """Host health as last published by whichever processes fetched from each host."""
+    now = datetime.datetime.utcnow()
+    query = db.query(SourceHealth)
+    if unhealthy_only:
+        query = query.filter((SourceHealth.state != "closed") | (SourceHealth.consecutive_failures > 0))
+    return [{
+        "host": e.host,
+        "state": e.state,
+        "consecutive_failures": e.consecutive_failures,
+        "trips": e.trips,
+        "retry_in_seconds": round(max((e.retry_at - now).total_seconds(), 0)) if e.state == "open" and e.retry_at else 0,
+        "last_error": e.last_error,
+        "last_failure_at": e.last_failure_at,
+        "successes": e.successes,
+        "failures": e.failures,
+        "updated_at": e.updated_at,
+    } for e in query.order_by(SourceHealth.host)]
+
+
+registry = SourceHealthRegistry()
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def guarded_get(url: str, **kwargs):
+    """
+    requests.get() behind the host's circuit breaker and rate limiter.
+    Raises SourceUnavailable without touching the network when the host is skipped;
+    timeouts, connection errors, 5xx and 429 count as host failures. Any other exception
+    is recorded too, so a half-open trial can never leave the breaker stuck half-open.
+    """
+    host = host_of(url)
+    registry.acquire(host)
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    kwargs.setdefault("headers", {"User-Agent": USER_AGENT})
+    try:
+        r = requests.get(url, **kwargs)
+    except Exception as e:
+        registry.record_failure(host, f"{type(e).__name__}: {e}")
+        raise
+    if r.status_code >= 500 or r.status_code == 429:
+        registry.record_failure(host, f"HTTP {r.status_code}")
+    else:
+        registry.record_success(host)
+    return r
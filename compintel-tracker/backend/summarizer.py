@@ -1,14 +1,31 @@
 import ollama
+import os
 import sys
 import re
 import json
+import time
 import logging
+import threading
 import requests # Still needed for ConnectionError handling
+from extractive import compress_text, split_sentences, rank_sentences, top_keywords
 
 # --- Configuration ---
 OLLAMA_MODEL = 'gemma:2b'
 OLLAMA_HOST = 'http://localhost:11434' 
 MIN_CONTENT_LENGTH = 100
+# Token budget for the article part of the prompt. Articles are pre-compressed to their most
+# informative sentences before prompting (prompt processing dominates latency on CPU-only Ollama).
+# Set to 0 to send the raw text[:15000] instead.
+PROMPT_TOKEN_BUDGET = int(os.environ.get("PROMPT_TOKEN_BUDGET", 1000))
+
+# --- Tier Selection (LLM vs. local extractive summarizer) ---
+LLM_TIMEOUT_SECONDS = float(os.environ.get("LLM_TIMEOUT_SECONDS", 120))       # Hard cap per Ollama call
+LLM_LATENCY_BUDGET = float(os.environ.get("LLM_LATENCY_BUDGET", 60))          # Smoothed latency above this => go local
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", 2))           # Ollama calls in flight per process
+LLM_QUEUE_WAIT_SECONDS = float(os.environ.get("LLM_QUEUE_WAIT_SECONDS", 30))  # Longer wait for a slot => backlog, go local
+LLM_RETRY_SECONDS = 120                                                       # Skip the LLM this long after it fails
+LLM_FAILURE_INSIGHTS = ("OLLAMA_CLI_FAILED", "GENERAL_ERROR", "MODEL_OUTPUT_INVALID")
+LLM_SERVICE_FAILURE_INSIGHTS = ("OLLAMA_CLI_FAILED", "GENERAL_ERROR")   # Ollama down/timed out, not the article's fault
 
 # --- Prompt for Structured JSON Output ---
 PROMPT_TEMPLATE = (
@@ -26,11 +43,14 @@ def summarize_text(text: str) -> dict:
         return {"bullets": ["Article content was too short or non-existent."], "insight": "CONTENT_TOO_SHORT", "tags": []}
 
     # Limit content length to prevent model overflow
-    prompt_content = text[:15000]
+    if PROMPT_TOKEN_BUDGET > 0:
+        prompt_content = compress_text(text, PROMPT_TOKEN_BUDGET)
+    else:
+        prompt_content = text[:15000]
     prompt = PROMPT_TEMPLATE.format(content=prompt_content)
     
     try:
-        client = ollama.Client(host=OLLAMA_HOST)
+        client = ollama.Client(host=OLLAMA_HOST, timeout=LLM_TIMEOUT_SECONDS)
         
         # Use the /api/generate endpoint for structured JSON output
         response = client.generate(
@@ -58,4 +78,119 @@ def summarize_text(text: str) -> dict:
         return {"bullets": ["Ollama connection failed. Is the service running?"], "insight": "OLLAMA_CLI_FAILED", "tags": []} 
     except Exception as e:
         logging.error(f"General Summarization Error: {e}")
-        return {"bullets": [prompt_content[:250] + "..."], "insight": "GENERAL_ERROR", "tags": []}
\ No newline at end of file
+        return {"bullets": [prompt_content[:250] + "..."], "insight": "GENERAL_ERROR", "tags": []}
+
+
+# ----------------------------------------------------------------------
+# --- LOCAL (MILLISECOND) SUMMARIZER ---
+# ----------------------------------------------------------------------
+
+def summarize_locally(text: str) -> dict:
+    """
+    Extractive fallback with the same schema as summarize_text(): the best-ranked
+    sentence is the insight, the next three (in article order) are the bullets and
+    the top TF-IDF terms are the tags.
+    """
+    if not text or len(text) < MIN_CONTENT_LENGTH:
+        return {"bullets": ["Article content was too short or non-existent."], "insight": "CONTENT_TOO_SHORT", "tags": []}
+
+    sentences = split_sentences(text)
+    if not sentences:
+        return {"bullets": [text[:250] + "..."], "insight": text[:250], "tags": []}
+
+    scores = rank_sentences(sentences)
+    order = sorted(range(len(sentences)), key=lambda i: -scores[i])
+    insight = sentences[order[0]][:300]
+    bullets = [sentences[i][:300] for i in sorted(order[1:4])] or [insight]
+    tags = [t.title() for t in top_keywords(sentences, k=3)]
+    return {"bullets": bullets, "insight": insight, "tags": tags}
+
+
+# ----------------------------------------------------------------------
+# --- TIERED SUMMARIZATION ---
+# ----------------------------------------------------------------------
+
+_llm_slots = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+_llm_lock = threading.Lock()
+_llm_health = {"avg_latency": 0.0, "down_until": 0.0, "slow_until": 0.0}
+
+
+def _record_llm_call(elapsed: float, failed: bool):
+    with _llm_lock:
+        if failed:
+            _llm_health["down_until"] = time.time() + LLM_RETRY_SECONDS
+        else:
+            now = time.time()
+            # Over budget: skip the LLM for a while, then re-measure it with a fresh sample
+            # (the average only moves when the LLM is called, so a permanent gate would never reopen)
+            probe = 0 < _llm_health["slow_until"] <= now
+            avg = _llm_health["avg_latency"]
+            _llm_health["avg_latency"] = avg = elapsed if avg == 0 or probe else 0.3 * elapsed + 0.7 * avg
+            _llm_health["slow_until"] = now + LLM_RETRY_SECONDS if avg > LLM_LATENCY_BUDGET else 0.0
+
+
+def llm_is_down() -> bool:
+    return time.time() < _llm_health["down_until"]
+
+
+def llm_is_slow() -> bool:
+    return time.time() < _llm_health["slow_until"]
+
+
+def _call_llm(text: str) -> dict:
+    """summarize_text() plus latency/failure bookkeeping; failures come back as their placeholder."""
+    started = time.perf_counter()
+    result = summarize_text(text)
+    # Invalid output is this article's problem: only an unreachable/timed-out Ollama marks the LLM down
+    _record_llm_call(time.perf_counter() - started, result.get("insight") in LLM_SERVICE_FAILURE_INSIGHTS)
+    return result
+
+
+def summarize_with_llm(text: str):
+    """Calls the LLM and records its latency/failure. Returns the summary, or None if the LLM failed."""
+    result = _call_llm(text)
+    return None if result.get("insight") in LLM_FAILURE_INSIGHTS else result
+
+
+def summarize_tiered(text: str):
+    """
+    Returns (summary, tier) where tier is "llm" or "local". The local tier is used when
+    the LLM recently failed, was recently over its latency budget, has no free slot within
+    LLM_QUEUE_WAIT_SECONDS (backlog), or fails on this call. "local" summaries are meant
+    to be re-queued for an LLM upgrade.
+    """
+    if not text or len(text) < MIN_CONTENT_LENGTH:
+        return summarize_text(text), "llm"  # Final answer; nothing to upgrade
+
+    if llm_is_down() or llm_is_slow():
+        return summarize_locally(text), "local"
+
+    if not _llm_slots.acquire(timeout=LLM_QUEUE_WAIT_SECONDS):
+        return summarize_locally(text), "local"
+    try:
+        result = summarize_with_llm(text)
+    finally:
+        _llm_slots.release()
+
+    if result is None:
+        return summarize_locally(text), "local"
+    return result, "llm"
+
+
+def summarize_if_idle(text: str):
+    """
+    Background upgrade path: runs the LLM only if it is up and a slot is free right now.
+    Returns ("busy", None), ("failed", None) or ("ok", summary). Only output the model got
+    wrong for this text is "failed"; connection errors and timeouts are "busy", since
+    retrying another article would fail the same way.
+    """
+    if llm_is_down() or not _llm_slots.acquire(blocking=False):
+        return "busy", None
+    try:
+        result = _call_llm(text)
+    finally:
+        _llm_slots.release()
+    insight = result.get("insight")
+    if insight in LLM_SERVICE_FAILURE_INSIGHTS:
+        return "busy", None
+    return ("failed", None) if insight in LLM_FAILURE_INSIGHTS else ("ok", result)
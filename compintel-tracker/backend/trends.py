@@ -0,0 +1,154 @@
+import datetime
+from sqlalchemy import func, select
+
+from models import SessionLocal, Article, TrendRollup
+from classifier import classify_feed_article, classify_insight_article
+
+# ----------------------------------------------------------------------
+# --- TREND ROLLUPS (Article counts by day x competitor x category x severity) ---
+# ----------------------------------------------------------------------
+
+ROLLUP_DIMENSIONS = ('competitor', 'category', 'severity')
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 3660
+
+
+def article_dimensions(article) -> tuple:
+    """(day, competitor, category, severity) bucket of an article, using the same rules as the feed/insights pages."""
+    day = (article.fetched_at or datetime.datetime.utcnow()).date()
+    category = classify_insight_article(article)["category"]
+    severity = classify_feed_article(article, warn=False)["severity"]
+    return day, article.competitor, category, severity
+
+
+def bump_rollup(db, dims: tuple, delta: int = 1):
+    """Adds `delta` to a rollup bucket inside the caller's transaction (the caller commits)."""
+    day, competitor, category, severity = dims
+    dialect = db.bind.dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(TrendRollup).values(
+            day=day, competitor=competitor, category=category, severity=severity, count=delta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['day', 'competitor', 'category', 'severity'],
+            set_={'count': TrendRollup.count + delta}
+        )
+        db.execute(stmt)
+        return
+
+    updated = db.query(TrendRollup).filter_by(
+        day=day, competitor=competitor, category=category, severity=severity
+    ).update({TrendRollup.count: TrendRollup.count + delta}, synchronize_session=False)
+    if not updated:
+        db.add(TrendRollup(day=day, competitor=competitor, category=category, severity=severity, count=delta))
+
+
+def record_article(db, article):
+    bump_rollup(db, article_dimensions(article), 1)
+
+
+def move_article(db, old_dims: tuple, article):
+    """Re-buckets an article whose summary changed (e.g. after an LLM upgrade)."""
+    new_dims = article_dimensions(article)
+    if new_dims != old_dims:
+        bump_rollup(db, old_dims, -1)
+        bump_rollup(db, new_dims, 1)
+
+
+def rollup_counts(db, batch_size: int = 5000, end_reads: bool = True) -> tuple:
+    """
+    Counts articles per rollup bucket from short keyset batches (`id > last` with LIMIT), so no
+    read cursor stays open for the whole table. With `end_reads` each batch's read transaction
+    is closed before the next one: on SQLite a long read would block every writer meanwhile.
+    Returns ({dims: count}, number of articles counted).
+    """
+    counts = {}
+    total = 0
+    last_id = 0
+    while True:
+        # Plain rows (no `content`); the classifiers only read these attributes
+        rows = db.execute(
+            select(Article.id, Article.competitor, Article.title, Article.summary,
+                   Article.url, Article.status, Article.fetched_at)
+            .where(Article.id > last_id)
+            .order_by(Article.id)
+            .limit(batch_size)
+        ).all()
+        if end_reads:
+            db.rollback()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        for article in rows:
+            dims = article_dimensions(article)
+            counts[dims] = counts.get(dims, 0) + 1
+        total += len(rows)
+    return counts, total
+
+
+def rebuild_rollups(db, batch_size: int = 5000, commit: bool = True) -> int:
+    """
+    Recomputes every rollup from `articles`. Offline only (migration 0007, benchmark data, the
+    CLI below): bumps made by ingest while it counts would be overwritten by the reinsert.
+    Returns the number of articles counted.
+    """
+    counts, total = rollup_counts(db, batch_size, end_reads=commit)
+    db.query(TrendRollup).delete(synchronize_session=False)
+    db.bulk_insert_mappings(TrendRollup, [
+        {"day": d, "competitor": c, "category": cat, "severity": s, "count": n}
+        for (d, c, cat, s), n in counts.items()
+    ])
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    return total
+
+
+def query_trends(db, start: datetime.date, end: datetime.date, group_by: list,
+                 interval: str = 'day', filters: dict = None) -> dict:
+    """
+    Sums rollup counts over [start, end] grouped by period plus `group_by` dimensions.
+    Returns the time series and the per-group totals over the whole range.
+    """
+    columns = [getattr(TrendRollup, d) for d in group_by]
+    query = db.query(TrendRollup.day, *columns, func.sum(TrendRollup.count)).filter(
+        TrendRollup.day >= start, TrendRollup.day <= end
+    )
+    for dim, value in (filters or {}).items():
+        query = query.filter(getattr(TrendRollup, dim) == value)
+    rows = query.group_by(TrendRollup.day, *columns).all()
+
+    series, totals = {}, {}
+    for row in rows:
+        day, keys, count = row[0], tuple(row[1:-1]), int(row[-1] or 0)
+        if not count:
+            continue
+        if isinstance(day, str):
+            day = datetime.date.fromisoformat(day)
+        period = day - datetime.timedelta(days=day.weekday()) if interval == 'week' else day
+        series[(period, keys)] = series.get((period, keys), 0) + count
+        totals[keys] = totals.get(keys, 0) + count
+
+    return {
+        "series": [
+            {"period": period.isoformat(), **dict(zip(group_by, keys)), "count": n}
+            for (period, keys), n in sorted(series.items(), key=lambda kv: (kv[0][0], kv[0][1]))
+        ],
+        "totals": sorted(
+            ({**dict(zip(group_by, keys)), "count": n} for keys, n in totals.items()),
+            key=lambda t: -t["count"]
+        ),
+    }
+
+
+if __name__ == '__main__':
+    db = SessionLocal()
+    try:
+        print(f"Rebuilt trend rollups from {rebuild_rollups(db)} articles.")
+    finally:
+        db.close()
@@ -1,9 +1,9 @@
 from bs4 import BeautifulSoup
 import requests
-from newspaper import Article as NPArticle
 
 def extract_text_from_url(url: str) -> str:
     try:
+        from newspaper import Article as NPArticle  # Heavy import: only load it when actually extracting
         a = NPArticle(url)
         a.download()
         a.parse()
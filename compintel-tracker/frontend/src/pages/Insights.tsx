@@ -1,6 +1,6 @@
 // frontend/src/pages/Insights.tsx
 
-import React, { useState, useEffect, useMemo } from 'react'; // 🌟 ADDED useMemo 🌟
+import React, { useState, useEffect, useMemo, useRef } from 'react'; // 🌟 ADDED useMemo 🌟
 import axios from 'axios';
 
 // --- Type Definitions ---
@@ -16,25 +16,45 @@ interface InsightData {
     tags?: string[]; // Used for extracting filter options
 }
 
+interface InsightKpis {
+    pending_actions: number;
+    high_priority: number;
+    total_insights: number;
+}
+
 // 🌟 NEW INTERFACE: To match the backend's structured response 🌟
 interface InsightsResponse {
     insights: InsightData[];
-    kpis: {
-        pending_actions: number;
-        high_priority: number;
-        total_insights: number;
-    }
+    kpis: InsightKpis;
+    server_time: string; // Cursor for the next ?updated_since= sync
+}
+
+// 🌟 DELTA RESPONSE: ?updated_since= sync and the batch status endpoint 🌟
+interface InsightsDelta {
+    insights: InsightData[]; // Changed rows still on the page (upsert)
+    removed: number[];       // Ids that left the page (actioned or deleted)
+    kpis: InsightKpis;
+    server_time?: string;    // Only on ?updated_since= responses
+    reset?: boolean;         // Cursor too old to sync from: reload everything
 }
 
+const API_BASE = 'http://localhost:5000';
+const SYNC_INTERVAL_MS = 60 * 1000; // Background delta sync instead of full reloads
+const BATCH_STATUS_MAX_IDS = 500;   // Matches the backend limit per batch request
+
 // --- Component: InsightCard (Includes Status Update Logic) ---
-const InsightCard = ({ data, onStatusChange }: { data: InsightData, onStatusChange: (id: number, status: string) => void }) => {
+const InsightCard = ({ data, selected, onToggleSelect, onStatusChange }: {
+    data: InsightData,
+    selected: boolean,
+    onToggleSelect: (id: number) => void,
+    onStatusChange: (ids: number[], status: string) => Promise<void>
+}) => {
     const [isActioning, setIsActioning] = useState(false);
 
     const handleAction = async (newStatus: string) => {
         setIsActioning(true);
         try {
-            await axios.put(`http://localhost:5000/api/insights/${data.id}/status`, { status: newStatus });
-            onStatusChange(data.id, newStatus); 
+            await onStatusChange([data.id], newStatus);
         } catch (e) {
             console.error("Error updating insight status:", e);
         } finally {
@@ -50,6 +70,12 @@ const InsightCard = ({ data, onStatusChange }: { data: InsightData, onStatusChan
     return (
         <div className={`insight-card card-priority-${priorityClass}`}>
             <div className="card-header">
+                <input
+                    type="checkbox"
+                    checked={selected}
+                    onChange={() => onToggleSelect(data.id)}
+                    aria-label="Select insight"
+                />
                 <span className={`insight-icon icon-${data.category.toLowerCase()}`}>{icon}</span>
                 <span className={`tag priority-tag tag-${data.category.toLowerCase()}`}>{data.category}</span>
                 <span className={`tag priority-tag tag-${priorityClass}`}>{data.priority}</span>
@@ -94,43 +120,29 @@ export default function InsightsPage() {
     const [loading, setLoading] = useState(true);
 
     // 🌟 KPI STATES 🌟
-    const [kpis, setKpis] = useState({ pending_actions: 0, high_priority: 0, total_insights: 0 });
+    const [kpis, setKpis] = useState<InsightKpis>({ pending_actions: 0, high_priority: 0, total_insights: 0 });
 
     // 🌟 FILTER STATES 🌟
     const [selectedCategory, setSelectedCategory] = useState('All Categories');
     const [selectedPriority, setSelectedPriority] = useState('All Priorities');
     const [selectedCompetitor, setSelectedCompetitor] = useState('All Competitors');
 
-    // 🌟 FILTER OPTIONS STATES 🌟
-    const [availableCategories, setAvailableCategories] = useState<string[]>([]);
-    const [availablePriorities, setAvailablePriorities] = useState<string[]>([]);
-    const [availableCompetitors, setAvailableCompetitors] = useState<string[]>([]);
+    // 🌟 BULK SELECTION STATES 🌟
+    const [selectedIds, setSelectedIds] = useState<Set<number>>(new Set());
+    const [isBulkUpdating, setIsBulkUpdating] = useState(false);
+
+    // server_time of the last full load / delta sync
+    const lastSync = useRef<string | null>(null);
 
 
     const fetchInsights = async () => {
         setLoading(true);
         try {
             // 🌟 Updated to match the backend response structure 🌟
-            const res = await axios.get<InsightsResponse>('http://localhost:5000/api/insights');
-            const fetchedInsights = res.data.insights;
-            
-            setInsights(fetchedInsights);
+            const res = await axios.get<InsightsResponse>(`${API_BASE}/api/insights`);
+            setInsights(res.data.insights);
             setKpis(res.data.kpis); // Set the KPIS
-
-            // 🌟 EXTRACT FILTER OPTIONS 🌟
-            const categories = new Set(fetchedInsights.map(i => i.category));
-            const priorities = new Set(fetchedInsights.map(i => i.priority));
-            const competitors = new Set(fetchedInsights.map(i => i.competitor));
-
-            setAvailableCategories(Array.from(categories).sort());
-            setAvailablePriorities(Array.from(priorities).sort((a, b) => {
-                // Custom sort: High > Medium
-                const order = { 'High Priority': 1, 'Medium Priority': 0 };
-                return (order[b] || 0) - (order[a] || 0);
-            }));
-            setAvailableCompetitors(Array.from(competitors).sort());
-
-
+            lastSync.current = res.data.server_time;
         } catch (error) {
             console.error("Error fetching insights:", error);
         } finally {
@@ -138,15 +150,92 @@ export default function InsightsPage() {
         }
     };
 
+    // 🌟 Merge a delta: drop removed ids, replace changed cards in place, prepend new ones 🌟
+    const applyDelta = (delta: InsightsDelta) => {
+        const removed = new Set(delta.removed);
+        const changed = new Map(delta.insights.map(i => [i.id, i]));
+
+        setInsights(prev => {
+            const kept = prev
+                .filter(i => !removed.has(i.id))
+                .map(i => changed.get(i.id) ?? i);
+            const existing = new Set(prev.map(i => i.id));
+            const added = delta.insights.filter(i => !existing.has(i.id));
+            return [...added, ...kept];
+        });
+        setSelectedIds(prev => new Set([...prev].filter(id => !removed.has(id))));
+        setKpis(delta.kpis);
+    };
+
+    const syncInsights = async () => {
+        if (!lastSync.current) return;
+        try {
+            const res = await axios.get<InsightsDelta>(`${API_BASE}/api/insights`, {
+                params: { updated_since: lastSync.current }
+            });
+            if (res.data.reset) {
+                await fetchInsights();
+                return;
+            }
+            applyDelta(res.data);
+            if (res.data.server_time) lastSync.current = res.data.server_time;
+        } catch (error) {
+            console.error("Error syncing insights:", error);
+        }
+    };
+
     useEffect(() => {
         fetchInsights();
+        const timer = setInterval(syncInsights, SYNC_INTERVAL_MS);
+        return () => clearInterval(timer);
     }, []);
 
-    const handleInsightStatusChange = (id: number, newStatus: string) => {
-        // Simple update: re-fetch all data to ensure KPIs are accurate
-        fetchInsights(); 
+    // 🌟 One request for any number of cards; the response carries the changed rows and fresh KPIs 🌟
+    const updateStatuses = async (ids: number[], newStatus: string) => {
+        for (let start = 0; start < ids.length; start += BATCH_STATUS_MAX_IDS) {
+            const res = await axios.post<InsightsDelta>(`${API_BASE}/api/insights/status`, {
+                ids: ids.slice(start, start + BATCH_STATUS_MAX_IDS),
+                status: newStatus
+            });
+            applyDelta(res.data);
+        }
+    };
+
+    const toggleSelect = (id: number) => {
+        setSelectedIds(prev => {
+            const next = new Set(prev);
+            if (next.has(id)) next.delete(id); else next.add(id);
+            return next;
+        });
     };
 
+    const handleBulkAction = async (newStatus: string) => {
+        setIsBulkUpdating(true);
+        try {
+            await updateStatuses(Array.from(selectedIds), newStatus);
+            setSelectedIds(new Set());
+        } catch (e) {
+            console.error("Error updating insight statuses:", e);
+        } finally {
+            setIsBulkUpdating(false);
+        }
+    };
+
+    // 🌟 FILTER OPTIONS (derived from the current insights, so deltas keep them up to date) 🌟
+    const availableCategories = useMemo(
+        () => Array.from(new Set(insights.map(i => i.category))).sort(), [insights]
+    );
+    const availablePriorities = useMemo(
+        () => Array.from(new Set(insights.map(i => i.priority))).sort((a, b) => {
+            // Custom sort: High > Medium
+            const order = { 'High Priority': 1, 'Medium Priority': 0 };
+            return (order[b] || 0) - (order[a] || 0);
+        }), [insights]
+    );
+    const availableCompetitors = useMemo(
+        () => Array.from(new Set(insights.map(i => i.competitor))).sort(), [insights]
+    );
+
     // 🌟 FILTERING LOGIC using useMemo 🌟
     const filteredInsights = useMemo(() => {
         return insights.filter(item => {
@@ -217,11 +306,30 @@ export default function InsightsPage() {
                 </div>
             </div>
             
+            {/* Bulk Actions (one batch request for every selected card) */}
+            {selectedIds.size > 0 && (
+                <div className="bulk-actions">
+                    <span>{selectedIds.size} selected</span>
+                    <button className="btn-actioned" onClick={() => handleBulkAction('actioned')} disabled={isBulkUpdating}>
+                        {isBulkUpdating ? 'Updating...' : `Mark ${selectedIds.size} as Actioned`}
+                    </button>
+                    <button className="btn-notes" onClick={() => setSelectedIds(new Set())} disabled={isBulkUpdating}>
+                        Clear Selection
+                    </button>
+                </div>
+            )}
+
             {/* Insights Feed (Uses filteredInsights) */}
             <div className="insights-feed">
                 {filteredInsights.length > 0 ? (
                     filteredInsights.map((item) => (
-                        <InsightCard key={item.id} data={item} onStatusChange={handleInsightStatusChange} />
+                        <InsightCard
+                            key={item.id}
+                            data={item}
+                            selected={selectedIds.has(item.id)}
+                            onToggleSelect={toggleSelect}
+                            onStatusChange={updateStatuses}
+                        />
                     ))
                 ) : (
                     <p className="no-data">No insights matching the current filters.</p>